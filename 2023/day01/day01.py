@@ -1,42 +1,120 @@
-from typing import Iterator
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, cast
 
-FILENAME = "input.txt"
+from aoc.mapreduce import LineJob
+from aoc.reader import Source, is_source, read_chunks, read_lines, resolve
+
+FILENAME: Path = Path(__file__).with_name("input.txt")
 DIGITS = "0123456789"
 SPELLED = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
-VALID = list(DIGITS) + SPELLED
-
-
-def gen_rows() -> Iterator:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
-
-
-def part1() -> int:
-    total = 0
-    for row in gen_rows():
-        first_digit = next(char for char in row if char in DIGITS)
-        last_digit = next(char for char in row[::-1] if char in DIGITS)
-        total += int(first_digit + last_digit)
-    return total
-
-
-def part2() -> int:
-    total = 0
-    for row in gen_rows():
-        ind_left = {row.find(d): d for d in VALID if row.find(d) != -1}
-        ind_right = {row.rfind(d): d for d in VALID if row.rfind(d) != -1}
-        indices = ind_left | ind_right
-        first_digit: str = indices[min(indices.keys())]
-        last_digit: str = indices[max(indices.keys())]
-        if first_digit in SPELLED:
-            first_digit = str(SPELLED.index(first_digit) + 1)
-        if last_digit in SPELLED:
-            last_digit = str(SPELLED.index(last_digit) + 1)
-        total += int(first_digit) * 10 + int(last_digit)
-    return total
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
+TOKEN_VALUES: dict[str, int] = {d: int(d) for d in DIGITS} | {word: i for i, word in enumerate(SPELLED, 1)}
+NO_MATCH = -1
+CHUNK_BYTES: int = 1024 * 1024
+CHUNK_ROWS: int = 16 * 1024
+
+Automaton = tuple[list[dict[str, int]], list[int]]
+
+
+def build_automaton(tokens: dict[str, int]) -> Automaton:
+    # Aho-Corasick trie with its failure links folded in, so every state has a direct transition per character
+    goto: list[dict[str, int]] = [{}]
+    output: list[int] = [NO_MATCH]
+    for token, value in tokens.items():
+        state = 0
+        for char in token:
+            if char not in goto[state]:
+                goto[state][char] = len(goto)
+                goto.append({})
+                output.append(NO_MATCH)
+            state = goto[state][char]
+        output[state] = value
+
+    transitions: list[dict[str, int]] = [dict(goto[0]) for _ in goto]
+    queue: deque[tuple[int, int]] = deque((child, 0) for child in goto[0].values())
+    while queue:
+        state, fail = queue.popleft()
+        if output[state] == NO_MATCH:
+            output[state] = output[fail]
+        transitions[state] = transitions[fail] | goto[state]
+        for char, child in goto[state].items():
+            queue.append((child, transitions[fail].get(char, 0)))
+    return transitions, output
+
+
+FORWARD: Automaton = build_automaton(TOKEN_VALUES)
+BACKWARD: Automaton = build_automaton({token[::-1]: value for token, value in TOKEN_VALUES.items()})
+
+
+def first_match(chars: Iterable[str], automaton: Automaton) -> int:
+    transitions, output = automaton
+    state = 0
+    for char in chars:
+        state = transitions[state].get(char, 0)
+        if output[state] != NO_MATCH:
+            return output[state]
+    raise ValueError("No digit found.")
+
+
+def gen_rows(source: Source = FILENAME) -> Iterator:
+    yield from read_lines(source)
+
+
+def parse_input(source: Source = FILENAME) -> list[str]:
+    return list(gen_rows(source))
+
+
+def calibration_value(row: str) -> int:
+    first_digit = next(char for char in row if char in DIGITS)
+    last_digit = next(char for char in row[::-1] if char in DIGITS)
+    return int(first_digit + last_digit)
+
+
+def part1_rows(rows: Source | Iterable[str] = FILENAME) -> int:
+    rows = resolve(rows, gen_rows)
+    return sum(calibration_value(row) for row in rows)
+
+
+def _buffer_calibration_sum(buffer: bytes | memoryview) -> int:
+    # imported here so that the line-by-line parts do not pay for numpy at load time
+    import numpy as np
+
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    values = data - np.uint8(ord("0"))
+    # keep only digits and line breaks, in order; a digit right after a break starts a line, one right before ends it
+    tokens = values.take(np.flatnonzero((values < 10) | (data == ord("\n"))))
+    breaks = tokens >= 10
+    first, last = ~breaks, ~breaks
+    first[1:] &= breaks[:-1]
+    last[:-1] &= breaks[1:]
+    return int((tokens * first).sum(dtype=np.int64)) * 10 + int((tokens * last).sum(dtype=np.int64))
+
+
+def _gen_buffers(rows: Source | Iterable[str]) -> Iterator[bytes | memoryview]:
+    # line-aligned chunks of bounded size, so that streamed input is never held whole
+    if is_source(rows):
+        yield from read_chunks(rows, CHUNK_BYTES)
+        return
+    lines = iter(cast(Iterable[str], rows))
+    while batch := list(islice(lines, CHUNK_ROWS)):
+        yield "\n".join(batch).encode()
+
+
+def part1_vectorized(rows: Source | Iterable[str] = FILENAME) -> int:
+    return sum(_buffer_calibration_sum(buffer) for buffer in _gen_buffers(rows))
+
+
+part1 = part1_rows
+
+
+def spelled_calibration_value(row: str) -> int:
+    return first_match(row, FORWARD) * 10 + first_match(reversed(row), BACKWARD)
+
+
+def part2(rows: Source | Iterable[str] = FILENAME) -> int:
+    rows = resolve(rows, gen_rows)
+    return sum(spelled_calibration_value(row) for row in rows)
+
+
+LINE_JOBS: dict[str, LineJob] = {"part1": LineJob(calibration_value), "part2": LineJob(spelled_calibration_value)}
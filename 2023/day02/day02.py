@@ -1,56 +1,104 @@
 import re
 from math import prod
-from typing import Iterator
+from pathlib import Path
+from typing import Iterable, Iterator
 
-FILENAME = "input.txt"
+from aoc.mapreduce import LineJob
+from aoc.reader import Source, read_lines, resolve
 
+FILENAME: Path = Path(__file__).with_name("input.txt")
+RGB_COUNTS: tuple[int, int, int] = (12, 13, 14)
+# one scan per row: "<count> <color>" pairs keyed by the color's first letter, and ";" between rounds
+TOKENS = re.compile(r"(\d+) ([rgb])|;")
+COLOR_INDEX: dict[str, int] = {"r": 0, "g": 1, "b": 2}
 
-def gen_rows() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
 
+def gen_rows(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
-def get_max_count(color: str, description: str) -> int:
-    pattern = rf"\d+ {color}"
-    if matches := re.findall(pattern, description):
-        return max(map(lambda x: int(x.split()[0]), matches))
-    else:
-        return 0
 
+def _tokens(row: str) -> tuple[int, list[tuple[str, str]]]:
+    game, round_desc = row.split(": ")
+    return int(game.split()[1]), TOKENS.findall(round_desc)
 
-def gen_parsed_rows() -> Iterator[tuple[int, tuple[int, int, int]]]:
-    for row in gen_rows():
-        game, round_desc = row.split(": ")
-        game_id = int(game.split()[1])
-        red_max_n = get_max_count("red", round_desc)
-        green_max_n = get_max_count("green", round_desc)
-        blue_max_n = get_max_count("blue", round_desc)
-        yield game_id, (red_max_n, green_max_n, blue_max_n)
+
+def parse_row(row: str) -> tuple[int, tuple[int, int, int]]:
+    game_id, tokens = _tokens(row)
+    maxima = [0, 0, 0]
+    for count, color in tokens:
+        if count:
+            i, n = COLOR_INDEX[color], int(count)
+            if n > maxima[i]:
+                maxima[i] = n
+    return game_id, (maxima[0], maxima[1], maxima[2])
+
+
+def parse_rounds(row: str) -> tuple[int, list[tuple[int, int, int]]]:
+    game_id, tokens = _tokens(row)
+    rounds: list[tuple[int, int, int]] = []
+    counts = [0, 0, 0]
+    for count, color in tokens:
+        if count:
+            counts[COLOR_INDEX[color]] = int(count)
+        else:
+            rounds.append((counts[0], counts[1], counts[2]))
+            counts = [0, 0, 0]
+    rounds.append((counts[0], counts[1], counts[2]))
+    return game_id, rounds
+
+
+def round_maxima(rounds: list[tuple[int, int, int]]) -> tuple[int, int, int]:
+    red, green, blue = zip(*rounds)
+    return max(red), max(green), max(blue)
+
+
+def gen_parsed_rows(source: Source = FILENAME) -> Iterator[tuple[int, tuple[int, int, int]]]:
+    for row in gen_rows(source):
+        yield parse_row(row)
+
+
+def gen_rounds(source: Source = FILENAME) -> Iterator[tuple[int, list[tuple[int, int, int]]]]:
+    for row in gen_rows(source):
+        yield parse_rounds(row)
+
+
+def parse_input(source: Source = FILENAME) -> list[tuple[int, tuple[int, int, int]]]:
+    return list(gen_parsed_rows(source))
 
 
 def game_possible(actual_rgb_counts: tuple[int, int, int], max_rgb_counts: tuple[int, int, int]) -> bool:
     return all(actual_cnt >= max_cnt for actual_cnt, max_cnt in zip(actual_rgb_counts, max_rgb_counts))
 
 
-def part1(actual_rgb_counts: tuple[int, int, int]) -> int:
+def part1(
+    games: Source | Iterable[tuple[int, tuple[int, int, int]]] = FILENAME,
+    actual_rgb_counts: tuple[int, int, int] = RGB_COUNTS,
+) -> int:
+    games = resolve(games, gen_parsed_rows)
     total = 0
-    for row in gen_parsed_rows():
+    for row in games:
         game_id, max_rgb_counts = row
         if game_possible(actual_rgb_counts, max_rgb_counts):
             total += game_id
     return total
 
 
-def part2() -> int:
+def part2(games: Source | Iterable[tuple[int, tuple[int, int, int]]] = FILENAME) -> int:
+    games = resolve(games, gen_parsed_rows)
     total = 0
-    for row in gen_parsed_rows():
+    for row in games:
         _, min_possible_rgb_count = row
         total += prod(min_possible_rgb_count)
     return total
 
 
-if __name__ == "__main__":
-    rgb_counts = (12, 13, 14)
-    print(f"Part 1: {part1(rgb_counts)}")
-    print(f"Part 2: {part2()}")
+def possible_game_id(row: str) -> int:
+    game_id, max_rgb_counts = parse_row(row)
+    return game_id if game_possible(RGB_COUNTS, max_rgb_counts) else 0
+
+
+def game_power(row: str) -> int:
+    return prod(parse_row(row)[1])
+
+
+LINE_JOBS: dict[str, LineJob] = {"part1": LineJob(possible_game_id), "part2": LineJob(game_power)}
@@ -1,20 +1,35 @@
 import re
 from collections import defaultdict
 from math import prod
-from typing import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, cast
 
-FILENAME = "input.txt"
+from aoc.reader import MappedInput, Source, is_source, read_lines, resolve
+
+if TYPE_CHECKING:
+    import numpy as np
+
+FILENAME: Path = Path(__file__).with_name("input.txt")
 DIGITS = "0123456789"
+NUMBER = re.compile(r"\d+")
+SYMBOL = re.compile(r"[^\d.]")
+GEAR = "*"
+
+# a row of the schematic with its numbers as (start, end, value) spans
+Row = tuple[str, list[tuple[int, int, int]]]
+EMPTY_ROW: Row = ("", [])
+
+
+def gen_rows(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
-def gen_rows() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
+def parse_input(source: Source = FILENAME) -> list[str]:
+    return list(gen_rows(source))
 
 
-def gen_nums_locs() -> Iterator[tuple[int, list[tuple[int, int]]]]:
-    for nrow, row in enumerate(gen_rows()):
+def gen_nums_locs(rows: list[str]) -> Iterator[tuple[int, list[tuple[int, int]]]]:
+    for nrow, row in enumerate(rows):
         matches = re.finditer(r"\d+", row)
         for m in matches:
             num = int(m.group(0))
@@ -31,44 +46,171 @@ def get_adjacent_locs(nrow: int, ncol: int) -> list[tuple[int, int]]:
     return locs
 
 
-def get_all_adjacent_locs() -> set[tuple[int, int]]:
+def get_all_adjacent_locs(rows: list[str]) -> set[tuple[int, int]]:
     adjacent: set[tuple[int, int]] = set()
     nonsymbols = set(f"{DIGITS}.")
-    for nrow, row in enumerate(gen_rows()):
+    for nrow, row in enumerate(rows):
         for ncol, char in enumerate(row):
             if char not in nonsymbols:
-                adjacent = adjacent | set(get_adjacent_locs(nrow, ncol))
+                adjacent.update(get_adjacent_locs(nrow, ncol))
     return adjacent
 
 
-def part1() -> int:
-    symbol_adjacent = get_all_adjacent_locs()
-    return sum(num for num, locs in gen_nums_locs() if any((loc in symbol_adjacent for loc in locs)))
+def part1_sets(rows: Source | list[str] = FILENAME) -> int:
+    rows = resolve(rows, parse_input)
+    symbol_adjacent = get_all_adjacent_locs(rows)
+    return sum(num for num, locs in gen_nums_locs(rows) if any((loc in symbol_adjacent for loc in locs)))
 
 
-def get_all_star_adjacent_locs() -> dict[tuple[int, int], tuple[int, int]]:
-    star_adjacent = {}
-    for nrow, row in enumerate(gen_rows()):
+def get_all_star_adjacent_locs(rows: list[str]) -> dict[tuple[int, int], list[tuple[int, int]]]:
+    star_adjacent = defaultdict(list)
+    for nrow, row in enumerate(rows):
         for ncol, char in enumerate(row):
             if char == "*":
                 for loc in get_adjacent_locs(nrow, ncol):
-                    star_adjacent[loc] = (nrow, ncol)
+                    star_adjacent[loc].append((nrow, ncol))
     return star_adjacent
 
 
-def part2() -> int:
-    star_adjacent = get_all_star_adjacent_locs()
+def part2_sets(rows: Source | list[str] = FILENAME) -> int:
+    rows = resolve(rows, parse_input)
+    star_adjacent = get_all_star_adjacent_locs(rows)
     star_loc_to_numbers = defaultdict(list)
 
-    for num, locs in gen_nums_locs():
-        for loc in locs:
-            if loc in star_adjacent:
-                star_loc_to_numbers[star_adjacent[loc]].append(num)
-                break
+    for num, locs in gen_nums_locs(rows):
+        for star in {star for loc in locs for star in star_adjacent.get(loc, [])}:
+            star_loc_to_numbers[star].append(num)
 
     return sum(prod(nums) for nums in star_loc_to_numbers.values() if len(nums) == 2)
 
 
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
+def gen_windows(rows: Iterable[str]) -> Iterator[tuple[Row, Row, Row]]:
+    # only the rows above and below are kept around, so memory does not grow with the height of the schematic
+    above, current = EMPTY_ROW, None
+    for text in rows:
+        row = (text, [(m.start(), m.end(), int(m[0])) for m in NUMBER.finditer(text)])
+        if current is not None:
+            yield above, current, row
+            above = current
+        current = row
+    if current is not None:
+        yield above, current, EMPTY_ROW
+
+
+def part_numbers(window: tuple[Row, Row, Row]) -> Iterator[int]:
+    (above, _), (text, numbers), (below, _) = window
+    search = SYMBOL.search
+    for start, end, value in numbers:
+        lo, hi = max(start - 1, 0), end + 1
+        if search(text, lo, hi) or search(above, lo, hi) or search(below, lo, hi):
+            yield value
+
+
+def gear_ratios(window: tuple[Row, Row, Row]) -> Iterator[int]:
+    text = window[1][0]
+    col = text.find(GEAR)
+    while col != -1:
+        adjacent = [value for _, numbers in window for start, end, value in numbers if start - 1 <= col <= end]
+        if len(adjacent) == 2:
+            yield adjacent[0] * adjacent[1]
+        col = text.find(GEAR, col + 1)
+
+
+def part1_stream(rows: Source | Iterable[str] = FILENAME) -> int:
+    rows = resolve(rows, gen_rows)
+    return sum(num for window in gen_windows(rows) for num in part_numbers(window))
+
+
+def part2_stream(rows: Source | Iterable[str] = FILENAME) -> int:
+    rows = resolve(rows, gen_rows)
+    return sum(ratio for window in gen_windows(rows) for ratio in gear_ratios(window))
+
+
+part1 = part1_stream
+part2 = part2_stream
+
+
+def load_grid(source: Source | Iterable[str] = FILENAME) -> "np.ndarray":
+    # imported here so that the pure Python engines do not pay for numpy at load time
+    import numpy as np
+
+    if not is_source(source):
+        source = "\n".join(cast(Iterable[str], source)).encode()
+    with MappedInput(source) as mapped:
+        shape = mapped.grid()
+        # copied out, so that the mapping can close
+        data = np.array(mapped.data, dtype=np.uint8)
+    size = shape.height * shape.stride
+    if len(data) < size:
+        data = np.concatenate((data, np.full(size - len(data), ord("\n"), dtype=np.uint8)))
+    grid = data[:size].reshape(shape.height, shape.stride)[:, : shape.width]
+    # a border of dots keeps neighbourhoods in bounds and numbers from running into the next row
+    return np.pad(grid, 1, constant_values=ord("."))
+
+
+def _numbers(grid: "np.ndarray") -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    import numpy as np
+
+    flat = grid.ravel()
+    values = flat - np.uint8(ord("0"))
+    positions = np.flatnonzero(values < 10)
+    if not len(positions):
+        return positions, np.zeros(0, dtype=np.int64), np.zeros(flat.shape, dtype=np.int64)
+    starts = np.concatenate(([True], positions[1:] != positions[:-1] + 1))
+    ends = np.concatenate((starts[1:], [True]))
+    offsets = np.flatnonzero(starts)
+    ids = np.cumsum(starts) - 1
+    exponents = positions[ends][ids] - positions
+    numbers = np.add.reduceat(values[positions].astype(np.int64) * 10**exponents, offsets)
+    # 1-based number id of every cell, 0 where there is no digit
+    labels = np.zeros(flat.shape, dtype=np.int64)
+    labels[positions] = ids + 1
+    return positions, numbers, labels.reshape(grid.shape)
+
+
+def _dilate(mask: "np.ndarray") -> "np.ndarray":
+    import numpy as np
+
+    # 3x3 convolution of the mask with a kernel of ones, as the OR of its nine shifts
+    padded = np.pad(mask, 1)
+    height, width = mask.shape
+    out = np.zeros_like(mask)
+    for dr in range(3):
+        for dc in range(3):
+            out |= padded[dr : dr + height, dc : dc + width]
+    return out
+
+
+def part1_vectorized(rows: Source | Iterable[str] = FILENAME) -> int:
+    import numpy as np
+
+    grid = load_grid(rows)
+    symbols = ((grid - np.uint8(ord("0"))) >= 10) & (grid != ord("."))
+    positions, numbers, labels = _numbers(grid)
+    if not len(numbers):
+        return 0
+    touching = _dilate(symbols).ravel()[positions]
+    hit = np.zeros(len(numbers) + 1, dtype=bool)
+    hit[labels.ravel()[positions[touching]]] = True
+    return int(numbers[hit[1:]].sum())
+
+
+def part2_vectorized(rows: Source | Iterable[str] = FILENAME) -> int:
+    import numpy as np
+
+    grid = load_grid(rows)
+    _, numbers, labels = _numbers(grid)
+    stars_r, stars_c = np.nonzero(grid == ord(GEAR))
+    if not len(numbers) or not len(stars_r):
+        return 0
+    neighbours = np.stack([labels[stars_r + dr, stars_c + dc] for dr in (-1, 0, 1) for dc in (-1, 0, 1)], axis=1)
+    neighbours.sort(axis=1)
+    distinct = (neighbours[:, 1:] != neighbours[:, :-1]) & (neighbours[:, 1:] > 0)
+    counts = distinct.sum(axis=1) + (neighbours[:, 0] > 0)
+    gears = neighbours[counts == 2]
+    if not len(gears):
+        return 0
+    # the largest label is the last column; the smallest non-zero one is the first past the zeros
+    largest = gears[:, -1]
+    smallest = np.where(gears > 0, gears, largest[:, None]).min(axis=1)
+    return int((numbers[largest - 1] * numbers[smallest - 1]).sum())
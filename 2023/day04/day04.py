@@ -1,48 +1,48 @@
 from collections import defaultdict
-from time import perf_counter
-from typing import Callable, Iterator
+from pathlib import Path
+from typing import Iterable, Iterator
 
-FILENAME = "input.txt"
+from aoc.mapreduce import LineJob
+from aoc.reader import Source, read_lines, resolve
 
+FILENAME: Path = Path(__file__).with_name("input.txt")
 
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        return f"Result = {res}. Execution took {(end-start) * 1000:.2f} ms."
 
-    return wrapper
+def gen_rows(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
-def gen_rows() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
+def winning_numbers_count(row: str) -> tuple[int, int]:
+    prefix, cards = row.split(": ")
+    card_id = int(prefix.split()[1])
+    winning, chosen = cards.split(" | ")
+    winning_set = set(winning.split())
+    chosen_set = set(chosen.split())
+    return card_id, len(winning_set.intersection(chosen_set))
 
 
-def gen_winning_numbers_count() -> Iterator[tuple[int, int]]:
-    for row in gen_rows():
-        prefix, cards = row.split(": ")
-        card_id = int(prefix.split()[1])
-        winning, chosen = cards.split(" | ")
-        winning_set = set(winning.split())
-        chosen_set = set(chosen.split())
-        yield card_id, len(winning_set.intersection(chosen_set))
+def gen_winning_numbers_count(source: Source = FILENAME) -> Iterator[tuple[int, int]]:
+    for row in gen_rows(source):
+        yield winning_numbers_count(row)
+
+
+def parse_input(source: Source = FILENAME) -> list[tuple[int, int]]:
+    return list(gen_winning_numbers_count(source))
 
 
 def calculate_points(winning_count: int) -> int:
     return 2 ** (winning_count - 1) if winning_count else 0
 
 
-def part1() -> int:
-    total_points: int = sum(calculate_points(win_count) for _, win_count in gen_winning_numbers_count())
+def part1(cards: Source | Iterable[tuple[int, int]] = FILENAME) -> int:
+    cards = resolve(cards, gen_winning_numbers_count)
+    total_points: int = sum(calculate_points(win_count) for _, win_count in cards)
     return total_points
 
 
-@timer
-def part2_recursive() -> int:
-    card_to_points: dict[int, int] = dict(gen_winning_numbers_count())
+def part2_recursive(cards: Source | list[tuple[int, int]] = FILENAME) -> int:
+    cards = resolve(cards, parse_input)
+    card_to_points: dict[int, int] = dict(cards)
     scratch_count: int = len(card_to_points)
 
     def process_card(card_id: int) -> int:
@@ -59,17 +59,23 @@ def part2_recursive() -> int:
     return scratch_count
 
 
-@timer
-def part2_dynamic() -> int:
+def part2_dynamic(cards: Source | Iterable[tuple[int, int]] = FILENAME) -> int:
+    cards = resolve(cards, gen_winning_numbers_count)
     card_count: defaultdict = defaultdict(int)
-    for card_id, win_count in gen_winning_numbers_count():
-        card_count[card_id] += 1
+    total = 0
+    for card_id, win_count in cards:
+        copies = card_count.pop(card_id, 0) + 1
+        total += copies
         for i in range(win_count):
-            card_count[card_id + 1 + i] += card_count[card_id]
-    return sum(card_count.values())
+            card_count[card_id + 1 + i] += copies
+    return total + sum(card_count.values())
+
+
+part2 = part2_dynamic
+
+
+def card_points(row: str) -> int:
+    return calculate_points(winning_numbers_count(row)[1])
 
 
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2 recursive: {part2_recursive()}")
-    print(f"Part 2 dynamic: {part2_dynamic()}")
+LINE_JOBS: dict[str, LineJob] = {"part1": LineJob(card_points)}
@@ -1,35 +1,15 @@
-from functools import wraps
-from time import perf_counter
-from typing import Callable, Iterator
+from pathlib import Path
+from typing import Iterator
 
-FILENAME: str = "input.txt"
+from aoc.reader import Source, read_lines, resolve
+
+FILENAME: Path = Path(__file__).with_name("input.txt")
 MAP_NAME_EOL: str = ":"
 NEXT_MAP: str = ""
 
 
-def timer(f=None, n=10) -> Callable:
-    def decorator(fn: Callable):
-        @wraps(fn)
-        def wrapper(*args, **kwargs) -> str:
-            total_time: float = 0
-            res = 0
-            for _ in range(n):
-                start = perf_counter()
-                res = fn(*args, **kwargs)
-                end = perf_counter()
-                total_time += end - start
-            avg = total_time / n
-            return f"Result = {res}. Execution took {avg * 1000:.2f} ms on average in {n} trials."
-
-        return wrapper
-
-    return decorator(f) if callable(f) else decorator
-
-
-def gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
+def gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
 def parse_numbers_line(line: str) -> tuple[int, range]:
@@ -39,8 +19,8 @@ def parse_numbers_line(line: str) -> tuple[int, range]:
     return src_dest_offset, src_range
 
 
-def parse_input() -> tuple[list[int], dict[str, dict[range, int]]]:
-    line_generator = gen_lines()
+def parse_input(source: Source = FILENAME) -> tuple[list[int], dict[str, dict[range, int]]]:
+    line_generator = gen_lines(source)
 
     seeds_line = next(line_generator)
     _ = next(line_generator)
@@ -74,14 +54,10 @@ def map_seed_to_loc(seed: int, mappings: dict[str, dict[range, int]]) -> int:
     return seed
 
 
-@timer(n=100)
-def part1():
-    seeds, mappings = parse_input()
-    lowest_loc = float("inf")
-    for seed in seeds:
-        loc = map_seed_to_loc(seed, mappings)
-        lowest_loc = min(lowest_loc, loc)
-    return lowest_loc
+def part1(almanac: Source | tuple[list[int], dict[str, dict[range, int]]] = FILENAME) -> int:
+    almanac = resolve(almanac, parse_input)
+    seeds, mappings = almanac
+    return min(map_seed_to_loc(seed, mappings) for seed in seeds)
 
 
 def convert_seed_list_to_ranges(seeds: list[int]) -> list[range]:
@@ -101,21 +77,19 @@ def get_endpoints_from_ranges(ranges: list[range]) -> list[int]:
 
 def reverse_map(initial: list[int], mapping: dict[range, int]) -> list[int]:
     result: list[int] = []
-    checked: set[int] = set()
 
+    # a number can have several preimages: one per range mapping onto it, and itself when no range covers it
     for num in initial:
+        if not any(num in r for r in mapping):
+            result.append(num)
         for r, offset in mapping.items():
             if (num + offset) in r:
                 result.append(num + offset)
-                checked.add(num)
-                break
-        if num not in checked:
-            result.append(num)
 
-    ranges_endpoints = get_endpoints_from_ranges(list(mapping.keys()))
-    result.extend(ranges_endpoints)
-    result.extend((ranges_endpoints[0] - 1, ranges_endpoints[-1] + 1))
-    return sorted(list(set(result)))
+    # every range starts a new piece of the mapping at its start, and the identity takes over again at its stop
+    for r in mapping:
+        result.extend((r.start, r.stop))
+    return sorted(set(result))
 
 
 def get_trimmed_seed_list(seeds: list[int], seed_ranges: list[range]) -> list[int]:
@@ -124,9 +98,9 @@ def get_trimmed_seed_list(seeds: list[int], seed_ranges: list[range]) -> list[in
     return sorted(list(set(result)))
 
 
-@timer
-def part2():
-    seeds, mappings = parse_input()
+def part2(almanac: Source | tuple[list[int], dict[str, dict[range, int]]] = FILENAME) -> int:
+    almanac = resolve(almanac, parse_input)
+    seeds, mappings = almanac
     seed_ranges = convert_seed_list_to_ranges(seeds)
     to_check: list[int] = []
 
@@ -135,13 +109,10 @@ def part2():
 
     seeds_to_check = get_trimmed_seed_list(to_check, seed_ranges)
 
-    lowest_loc = float("inf")
-    for seed in seeds_to_check:
-        loc = map_seed_to_loc(seed, mappings)
-        lowest_loc = min(lowest_loc, loc)
-    return lowest_loc
+    return min(map_seed_to_loc(seed, mappings) for seed in seeds_to_check)
 
 
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
+def part2_brute_force(almanac: Source | tuple[list[int], dict[str, dict[range, int]]] = FILENAME) -> int:
+    almanac = resolve(almanac, parse_input)
+    seeds, mappings = almanac
+    return min(map_seed_to_loc(seed, mappings) for r in convert_seed_list_to_ranges(seeds) for seed in r)
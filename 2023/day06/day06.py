@@ -1,13 +1,14 @@
-import re
+from pathlib import Path
 
-FILENAME: str = "input.txt"
+from aoc.reader import MappedInput, Source, resolve
 
+FILENAME: Path = Path(__file__).with_name("input.txt")
 
-def parse_input() -> tuple[list[int], list[int]]:
-    with open(FILENAME, "r") as file:
-        lines = file.readlines()
-    times = [int(t) for t in re.findall(r"\d+", lines[0])]
-    dists = [int(d) for d in re.findall(r"\d+", lines[1])]
+
+def parse_input(source: Source = FILENAME) -> tuple[list[int], list[int]]:
+    with MappedInput(source) as mapped:
+        times = list(mapped.ints(line=0))
+        dists = list(mapped.ints(line=1))
     return times, dists
 
 
@@ -28,21 +29,18 @@ def count_ways(t_total: int, dist: int) -> int:
     return r_end - r_start + 1
 
 
-def part1() -> int:
-    times, dists = parse_input()
+def part1(races: Source | tuple[list[int], list[int]] = FILENAME) -> int:
+    races = resolve(races, parse_input)
+    times, dists = races
     ways_prod = 1
     for t_total, dist in zip(times, dists):
         ways_prod *= count_ways(t_total, dist)
     return ways_prod
 
 
-def part2() -> int:
-    times, dists = parse_input()
+def part2(races: Source | tuple[list[int], list[int]] = FILENAME) -> int:
+    races = resolve(races, parse_input)
+    times, dists = races
     time = int("".join([str(t) for t in times]))
     dist = int("".join([str(d) for d in dists]))
     return count_ways(time, dist)
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
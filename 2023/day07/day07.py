@@ -1,6 +1,11 @@
+from itertools import chain
+from pathlib import Path
 from typing import Iterator
 
-FILENAME = "input.txt"
+from aoc.mapreduce import LineJob
+from aoc.reader import Source, read_lines, resolve
+
+FILENAME: Path = Path(__file__).with_name("input.txt")
 CARD_TO_VALUE_1: dict[str, int] = {
     "2": 2,
     "3": 3,
@@ -34,15 +39,13 @@ CARD_TO_VALUE_2: dict[str, int] = {
 }
 
 
-def _gen_rows() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
+def _gen_rows(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
-def get_hand_to_bid_mapping() -> dict[str, int]:
+def parse_input(source: Source = FILENAME) -> dict[str, int]:
     res: dict[str, int] = {}
-    for row in _gen_rows():
+    for row in _gen_rows(source):
         _list = row.split()
         res[_list[0]] = int(_list[1])
     return res
@@ -63,8 +66,8 @@ def get_hand_value(hand: str) -> int:
     return int(hand_value)
 
 
-def part1() -> int:
-    hand_to_bid = get_hand_to_bid_mapping()
+def part1(hand_to_bid: Source | dict[str, int] = FILENAME) -> int:
+    hand_to_bid = resolve(hand_to_bid, parse_input)
     ordering: list[tuple[str, int]] = [(hand, get_hand_value(hand)) for hand in hand_to_bid]
     ordering.sort(key=lambda x: x[1])
     return sum(hand_to_bid[hand] * (i + 1) for i, (hand, _) in enumerate(ordering))
@@ -85,13 +88,29 @@ def get_hand_value_with_jokers(hand: str) -> int:
     return int(hand_value)
 
 
-def part2() -> int:
-    hand_to_bid = get_hand_to_bid_mapping()
+def part2(hand_to_bid: Source | dict[str, int] = FILENAME) -> int:
+    hand_to_bid = resolve(hand_to_bid, parse_input)
     ordering: list[tuple[str, int]] = [(hand, get_hand_value_with_jokers(hand)) for hand in hand_to_bid]
     ordering.sort(key=lambda x: x[1])
     return sum(hand_to_bid[hand] * (i + 1) for i, (hand, _) in enumerate(ordering))
 
 
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
+def valued_bid(row: str) -> tuple[int, int]:
+    hand, bid = row.split()
+    return get_hand_value(hand), int(bid)
+
+
+def valued_bid_with_jokers(row: str) -> tuple[int, int]:
+    hand, bid = row.split()
+    return get_hand_value_with_jokers(hand), int(bid)
+
+
+def total_winnings(chunks: list[list[tuple[int, int]]]) -> int:
+    ordering = sorted(chain.from_iterable(chunks))
+    return sum(bid * (i + 1) for i, (_, bid) in enumerate(ordering))
+
+
+LINE_JOBS: dict[str, LineJob] = {
+    "part1": LineJob(valued_bid, combine=list, finish=total_winnings),
+    "part2": LineJob(valued_bid_with_jokers, combine=list, finish=total_winnings),
+}
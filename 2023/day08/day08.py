@@ -1,19 +1,20 @@
 import itertools
 import math
 import re
+from pathlib import Path
 from typing import Iterator
 
-FILENAME = "input.txt"
+from aoc.reader import Source, read_lines, resolve
 
+FILENAME: Path = Path(__file__).with_name("input.txt")
 
-def _gen_rows() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
 
+def _gen_rows(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
-def parse_input() -> tuple[list[int], dict[str, tuple[str, str]]]:
-    line_gen = _gen_rows()
+
+def parse_input(source: Source = FILENAME) -> tuple[list[int], dict[str, tuple[str, str]]]:
+    line_gen = _gen_rows(source)
     instructions = [int(d) for d in next(line_gen).replace("L", "0").replace("R", "1")]
     _ = next(line_gen)
     mapping: dict[str, tuple[str, str]] = {}
@@ -35,17 +36,14 @@ def navigate(start: str, end: str, instructions: list[int], mapping: dict[str, t
     return steps
 
 
-def part1() -> int:
-    instructions, mapping = parse_input()
+def part1(network: Source | tuple[list[int], dict[str, tuple[str, str]]] = FILENAME) -> int:
+    network = resolve(network, parse_input)
+    instructions, mapping = network
     return navigate("AAA", "ZZZ", instructions, mapping)
 
 
-def part2() -> int:
-    instructions, mapping = parse_input()
+def part2(network: Source | tuple[list[int], dict[str, tuple[str, str]]] = FILENAME) -> int:
+    network = resolve(network, parse_input)
+    instructions, mapping = network
     starting_points = [k for k in mapping if k.endswith("A")]
     return math.lcm(*[navigate(start, "Z", instructions, mapping) for start in starting_points])
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
@@ -1,19 +1,25 @@
-from typing import Iterator
+from pathlib import Path
+from typing import Iterable, Iterator
 
-FILENAME = "input.txt"
+from aoc.mapreduce import LineJob
+from aoc.reader import Source, read_lines, resolve
 
+FILENAME: Path = Path(__file__).with_name("input.txt")
 
-def _gen_rows() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
 
+def _gen_rows(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
-def parse_rows() -> Iterator[list[int]]:
-    for row in _gen_rows():
+
+def _gen_histories(source: Source = FILENAME) -> Iterator[list[int]]:
+    for row in _gen_rows(source):
         yield [int(d) for d in row.split()]
 
 
+def parse_input(source: Source = FILENAME) -> list[list[int]]:
+    return list(_gen_histories(source))
+
+
 def get_diffs(vals: list[int]) -> tuple[list[int], bool]:
     diffs = [vals[i] - vals[i - 1] for i in range(1, len(vals))]
     return diffs, len(set(diffs)) == 1
@@ -28,14 +34,22 @@ def forecast(vals: list[int]) -> int:
     return next_val
 
 
-def part1() -> int:
-    return sum(forecast(row) for row in parse_rows())
+def part1(histories: Source | Iterable[list[int]] = FILENAME) -> int:
+    histories = resolve(histories, _gen_histories)
+    return sum(forecast(row) for row in histories)
+
+
+def part2(histories: Source | Iterable[list[int]] = FILENAME) -> int:
+    histories = resolve(histories, _gen_histories)
+    return sum(forecast(list(reversed(row))) for row in histories)
+
+
+def next_value(row: str) -> int:
+    return forecast([int(d) for d in row.split()])
 
 
-def part2() -> int:
-    return sum(forecast(list(reversed(row))) for row in parse_rows())
+def previous_value(row: str) -> int:
+    return forecast([int(d) for d in reversed(row.split())])
 
 
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
+LINE_JOBS: dict[str, LineJob] = {"part1": LineJob(next_value), "part2": LineJob(previous_value)}
@@ -1,20 +1,10 @@
 from __future__ import annotations
 
-from time import perf_counter
-from typing import Callable, Iterator, NamedTuple
+from pathlib import Path
+from typing import Iterator, NamedTuple
 
-import numpy as np
-from matplotlib.path import Path
-
-
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        return f"Result = {res}. Execution took {(end-start) * 1000:.2f} ms."
-
-    return wrapper
+from aoc.grid import Grid
+from aoc.reader import Source, read_lines, resolve
 
 
 class Dir(NamedTuple):
@@ -34,6 +24,8 @@ class Coord(NamedTuple):
 
 
 class Tile:
+    __slots__ = ("symbol", "coord", "prev", "next")
+
     def __init__(self, symbol: str, coord: Coord, prev: Tile | None = None):
         self.symbol = symbol
         self.coord = coord
@@ -45,22 +37,22 @@ class Tile:
             return NotImplemented
         return self.symbol == other.symbol and self.coord == other.coord
 
-    def get_next(self) -> Tile:
+    def get_next(self, area: Grid) -> Tile:
         if self.symbol == "S":
-            return self._get_prev_and_next()
+            return self._get_prev_and_next(area)
         for _dir in CONNS[self.symbol]:
             next_loc = self.coord + _dir
             if self.prev.coord == next_loc:  # type: ignore[union-attr]
                 continue
-            self.next = Tile(symbol=self.get_symbol_by_coord(next_loc), coord=next_loc, prev=self)
+            self.next = Tile(symbol=self.get_symbol_by_coord(area, next_loc), coord=next_loc, prev=self)
         assert self.next
         return self.next
 
-    def _get_prev_and_next(self) -> Tile:
+    def _get_prev_and_next(self, area: Grid) -> Tile:
         connected: list[Tile] = []
         for _dir in CONNS[self.symbol]:
             next_loc = self.coord + _dir
-            next_symbol = self.get_symbol_by_coord(next_loc)
+            next_symbol = self.get_symbol_by_coord(area, next_loc)
             if _dir.opposite() in CONNS[next_symbol]:
                 connected.append(Tile(symbol=next_symbol, coord=next_loc, prev=self))
         assert len(connected) == 2
@@ -69,15 +61,15 @@ class Tile:
         return self.next
 
     @staticmethod
-    def get_symbol_by_coord(coord: Coord) -> str:
-        return AREA[coord.x][coord.y]
+    def get_symbol_by_coord(area: Grid, coord: Coord) -> str:
+        return chr(area.get(coord, GROUND))
 
     def __repr__(self):
         return f"Symbol: {self.symbol}, coords: {self.coord}"
 
 
-FILENAME: str = "input.txt"
-AREA: list[list[str]] = []
+FILENAME: Path = Path(__file__).with_name("input.txt")
+GROUND: int = ord(".")
 CONNS: dict[str, list[Dir]] = {
     "F": [Dir(0, 1), Dir(1, 0)],
     "-": [Dir(0, -1), Dir(0, 1)],
@@ -90,61 +82,52 @@ CONNS: dict[str, list[Dir]] = {
 }
 
 
-def _gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
+def _gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
-def parse_map() -> tuple[int, int]:
-    global AREA
-    AREA = []
-    start = None
-    for n_row, line in enumerate(_gen_lines()):
-        row = list(line)
-        if not start:
-            start = (n_row, row.index("S")) if "S" in row else None
-        AREA.append(row)
+def parse_input(source: Source = FILENAME) -> tuple[Grid, tuple[int, int]]:
+    area = Grid.from_lines(_gen_lines(source))
+    start = area.find(ord("S"))
     assert start
-    return start
+    return area, start
 
 
-def get_loop(start_tile: Tile) -> list[Tile]:
+def get_loop(start_tile: Tile, area: Grid) -> list[Tile]:
     loop: list[Tile] = [start_tile]
-    curr_tile = start_tile.get_next()
+    curr_tile = start_tile.get_next(area)
     loop.append(curr_tile)
     while curr_tile != start_tile.prev:
-        curr_tile = curr_tile.get_next()
+        curr_tile = curr_tile.get_next(area)
         loop.append(curr_tile)
     return loop
 
 
-@timer
-def part1() -> float:
-    start_pos = parse_map()
+def part1(maze: Source | tuple[Grid, tuple[int, int]] = FILENAME) -> int:
+    maze = resolve(maze, parse_input)
+    area, start_pos = maze
     start_tile = Tile(symbol="S", coord=Coord(start_pos[0], start_pos[1]))
-    loop = get_loop(start_tile)
+    loop = get_loop(start_tile, area)
     return len(loop) // 2
 
 
-def calculate_tiles_inside_polygon(vertices: list[tuple[int, int]]) -> int:
+def calculate_tiles_inside_polygon(vertices: list[tuple[int, int]], area: Grid) -> int:
+    import numpy as np
+    from matplotlib.path import Path as Polygon
+
+    on_loop = set(vertices)
     points: list[tuple[int, int]] = [
-        (x, y) for x in range(len(AREA)) for y in range(len(AREA[0])) if (x, y) not in vertices
+        (x, y) for x in range(area.height) for y in range(area.width) if (x, y) not in on_loop
     ]
-    p = Path(np.array(vertices))
+    p = Polygon(np.array(vertices))
     grid = p.contains_points(np.array(points))
     return np.count_nonzero(grid)
 
 
-@timer
-def part2() -> int:
-    start_pos = parse_map()
+def part2(maze: Source | tuple[Grid, tuple[int, int]] = FILENAME) -> int:
+    maze = resolve(maze, parse_input)
+    area, start_pos = maze
     start_tile = Tile(symbol="S", coord=Coord(start_pos[0], start_pos[1]))
-    loop = get_loop(start_tile)
+    loop = get_loop(start_tile, area)
     vertices = [(tile.coord.x, tile.coord.y) for tile in loop]
-    return calculate_tiles_inside_polygon(vertices)
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
+    return calculate_tiles_inside_polygon(vertices, area)
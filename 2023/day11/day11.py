@@ -1,55 +1,35 @@
 from itertools import combinations
-from time import perf_counter
-from typing import Callable, Iterator
-
-FILENAME: str = "input.txt"
-
-
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        total = end - start
-        mult: int = 1000
-        unit: str = "ms"
-        if total >= 1:
-            mult = 1
-            unit = "s"
-        return f"Result = {res}. Execution took {total * mult:.2f} {unit}."
-
-    return wrapper
-
-
-def _gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
-
-
-def get_space_data() -> tuple[list[tuple[int, int]], list[int], list[int]]:
-    galaxies: list[tuple[int, int]] = []
-    rows_with_galaxies: set[int] = set()
-    cols_with_galaxies: set[int] = set()
-    ir, ic = 0, 0
-    for ir, line in enumerate(_gen_lines()):
-        for ic, char in enumerate(line):
-            if char == "#":
-                galaxies.append((ir, ic))
-                rows_with_galaxies.add(ir)
-                cols_with_galaxies.add(ic)
-    r_exp = set(list(range(ir))) - rows_with_galaxies
-    c_exp = set(list(range(ic))) - cols_with_galaxies
+from pathlib import Path
+from typing import Iterator
+
+from aoc.grid import Grid
+from aoc.reader import Source, read_lines, resolve
+
+FILENAME: Path = Path(__file__).with_name("input.txt")
+
+
+def _gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
+
+
+def parse_input(source: Source = FILENAME) -> tuple[list[tuple[int, int]], list[int], list[int]]:
+    space = Grid.from_lines(_gen_lines(source))
+    galaxies: list[tuple[int, int]] = list(space.positions(ord("#")))
+    rows_with_galaxies: set[int] = {r for r, _ in galaxies}
+    cols_with_galaxies: set[int] = {c for _, c in galaxies}
+    r_exp = set(range(space.height - 1)) - rows_with_galaxies
+    c_exp = set(range(space.width - 1)) - cols_with_galaxies
     return galaxies, list(r_exp), list(c_exp)
 
 
 def expand(galaxies: list[tuple[int, int]], r_exp: list[int], c_exp: list[int], rate: int) -> list[tuple[int, int]]:
-    for i, galaxy in enumerate(galaxies):
+    expanded: list[tuple[int, int]] = []
+    for galaxy in galaxies:
         r_inc = sum(galaxy[0] > r_num for r_num in r_exp)
         c_inc = sum(galaxy[1] > c_num for c_num in c_exp)
-        galaxies[i] = (galaxy[0] + r_inc * (rate - 1), galaxy[1] + c_inc * (rate - 1))
+        expanded.append((galaxy[0] + r_inc * (rate - 1), galaxy[1] + c_inc * (rate - 1)))
 
-    return galaxies
+    return expanded
 
 
 def get_dist(start: tuple[int, int], end: tuple[int, int]) -> int:
@@ -61,18 +41,13 @@ def get_sum_of_distances(galaxies: list[tuple[int, int]]) -> int:
     return total
 
 
-@timer
-def part1() -> int:
-    galaxies = expand(*get_space_data(), rate=2)
+def part1(space: Source | tuple[list[tuple[int, int]], list[int], list[int]] = FILENAME) -> int:
+    space = resolve(space, parse_input)
+    galaxies = expand(*space, rate=2)
     return get_sum_of_distances(galaxies)
 
 
-@timer
-def part2() -> int:
-    galaxies = expand(*get_space_data(), rate=1_000_000)
+def part2(space: Source | tuple[list[tuple[int, int]], list[int], list[int]] = FILENAME) -> int:
+    space = resolve(space, parse_input)
+    galaxies = expand(*space, rate=1_000_000)
     return get_sum_of_distances(galaxies)
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
@@ -1,7 +1,10 @@
-from time import perf_counter
-from typing import Callable, Iterator
+from pathlib import Path
+from typing import Iterator
 
-FILENAME: str = "input.txt"
+from aoc.grid import Grid
+from aoc.reader import Source, read_lines, resolve
+
+FILENAME: Path = Path(__file__).with_name("input.txt")
 
 
 class ReflectionNotFound(Exception):
@@ -10,44 +13,30 @@ class ReflectionNotFound(Exception):
 
     def __str__(self):
         info_line = "No reflection found for the following pattern: \n"
-        printed_pattern = "\n".join(self.pattern)
+        printed_pattern = str(self.pattern)
         return info_line + printed_pattern
 
 
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        total = end - start
-        mult: int = 1000
-        unit: str = "ms"
-        if total >= 1:
-            mult = 1
-            unit = "s"
-        return f"Result = {res}. Execution took {total * mult:.2f} {unit}."
-
-    return wrapper
-
+def _gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
-def _gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
 
-
-def gen_patterns() -> Iterator[list[str]]:
+def gen_patterns(source: Source = FILENAME) -> Iterator[Grid]:
     pattern: list[str] = []
-    for line in _gen_lines():
+    for line in _gen_lines(source):
         if not line:
-            yield pattern
+            yield Grid.from_lines(pattern)
             pattern = []
         else:
             pattern.append(line)
-    yield pattern
+    yield Grid.from_lines(pattern)
+
 
+def parse_input(source: Source = FILENAME) -> list[Grid]:
+    return list(gen_patterns(source))
 
-def find_horizontal(pattern: list[str]) -> tuple[int, int] | None:
+
+def find_horizontal(pattern: list[bytes]) -> tuple[int, int] | None:
     for i in range(len(pattern) - 1):
         n_pairs = min(i + 1, len(pattern) - i - 1)
         found = all(pattern[i - j] == pattern[i + 1 + j] for j in range(n_pairs))
@@ -56,21 +45,15 @@ def find_horizontal(pattern: list[str]) -> tuple[int, int] | None:
     return None
 
 
-def transpose(pattern: list[str]) -> list[str]:
-    transposed: list[str] = ["".join(row[col] for row in reversed(pattern)) for col in range(len(pattern[0]))]
-    return transposed
-
-
-def find_vertical(pattern: list[str]) -> tuple[int, int] | None:
-    pattern = transpose(pattern)
-    return find_horizontal(pattern)
+def find_vertical(pattern: Grid) -> tuple[int, int] | None:
+    return find_horizontal(pattern.transpose().rows())
 
 
-@timer
-def part1() -> int:
+def part1(patterns: Source | list[Grid] = FILENAME) -> int:
+    patterns = resolve(patterns, parse_input)
     total = 0
-    for pattern in gen_patterns():
-        if hor := find_horizontal(pattern):
+    for pattern in patterns:
+        if hor := find_horizontal(pattern.rows()):
             total += hor[1] * 100
         elif vert := find_vertical(pattern):
             total += vert[1]
@@ -79,11 +62,11 @@ def part1() -> int:
     return total
 
 
-def almost_equal(s1: str, s2: str) -> bool:
+def almost_equal(s1: bytes, s2: bytes) -> bool:
     return [a != b for a, b in zip(s1, s2)].count(True) == 1
 
 
-def find_horizontal_with_smudge(pattern: list[str]) -> tuple[int, int] | None:
+def find_horizontal_with_smudge(pattern: list[bytes]) -> tuple[int, int] | None:
     for i in range(len(pattern) - 1):
         n_pairs = min(i + 1, len(pattern) - i - 1)
         exact_matches = [pattern[i - j] == pattern[i + 1 + j] for j in range(n_pairs)]
@@ -94,24 +77,18 @@ def find_horizontal_with_smudge(pattern: list[str]) -> tuple[int, int] | None:
     return None
 
 
-def find_vertical_with_smudge(pattern: list[str]) -> tuple[int, int] | None:
-    pattern = transpose(pattern)
-    return find_horizontal_with_smudge(pattern)
+def find_vertical_with_smudge(pattern: Grid) -> tuple[int, int] | None:
+    return find_horizontal_with_smudge(pattern.transpose().rows())
 
 
-@timer
-def part2() -> int:
+def part2(patterns: Source | list[Grid] = FILENAME) -> int:
+    patterns = resolve(patterns, parse_input)
     total = 0
-    for pattern in gen_patterns():
-        if hor := find_horizontal_with_smudge(pattern):
+    for pattern in patterns:
+        if hor := find_horizontal_with_smudge(pattern.rows()):
             total += hor[1] * 100
         elif vert := find_vertical_with_smudge(pattern):
             total += vert[1]
         else:
             raise ReflectionNotFound(pattern)
     return total
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
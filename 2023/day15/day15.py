@@ -1,22 +1,13 @@
-from time import perf_counter
-from typing import Callable
+from pathlib import Path
 
-FILENAME: str = "input.txt"
+from aoc.reader import MappedInput, Source, resolve
 
+FILENAME: Path = Path(__file__).with_name("input.txt")
 
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        return f"Result = {res}. Execution took {(end-start) * 1000:.2f} ms."
 
-    return wrapper
-
-
-def get_strings() -> list[str]:
-    with open(FILENAME, "r") as file:
-        line = file.readline()
+def parse_input(source: Source = FILENAME) -> list[str]:
+    with MappedInput(source) as mapped:
+        line = next(mapped.text_lines(), "")
     return line.split(",")
 
 
@@ -34,9 +25,8 @@ def hash_str(s: str) -> int:
     return val
 
 
-@timer
-def part1() -> int:
-    strings = get_strings()
+def part1(strings: Source | list[str] = FILENAME) -> int:
+    strings = resolve(strings, parse_input)
     return sum(hash_str(s) for s in strings)
 
 
@@ -47,9 +37,8 @@ def split_str(s: str) -> tuple[str, int]:
     return label, int(focal)
 
 
-@timer
-def part2() -> int:
-    strings = get_strings()
+def part2(strings: Source | list[str] = FILENAME) -> int:
+    strings = resolve(strings, parse_input)
     boxes: list[tuple[list[str], list[int]]] = [([], []) for _ in range(256)]
     not_empty: set[int] = set()
     label_to_hash: dict[str, int] = {}
@@ -76,8 +65,3 @@ def part2() -> int:
         for j, focal in enumerate(box[1]):
             total += (i + 1) * (j + 1) * focal
     return total
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
@@ -2,52 +2,24 @@ from __future__ import annotations
 
 from collections import deque
 from enum import Enum
-from time import perf_counter
-from typing import Callable, Iterator, NamedTuple
+from pathlib import Path
+from typing import Iterator, NamedTuple
 
-FILENAME: str = "input.txt"
-EMPTY, HSPLIT, VSPLIT, FSLANT, BSLANT = ".", "-", "|", "/", "\\"
+from aoc.grid import Grid
+from aoc.reader import Source, read_lines, resolve
+
+FILENAME: Path = Path(__file__).with_name("input.txt")
+EMPTY, HSPLIT, VSPLIT, FSLANT, BSLANT, OUTSIDE = b".-|/\\ "
 SPLITTERS = [HSPLIT, VSPLIT]
 MIRRORS = [FSLANT, BSLANT]
 
 
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        total = end - start
-        mult: int = 1000
-        unit: str = "ms"
-        if total >= 1:
-            mult = 1
-            unit = "s"
-        return f"Result = {res}. Execution took {total * mult:.2f} {unit}."
-
-    return wrapper
-
-
-def _gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
-
+def _gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
-def parse_input() -> tuple[dict[tuple[int, int], str], tuple[int, int]]:
-    res: dict[tuple[int, int], str] = {}
-    r, c = 0, 0
-    for r, line in enumerate(_gen_lines()):
-        for c, char in enumerate(line):
-            res[(r, c)] = char
-    return res, (r + 1, c + 1)
 
-
-class Coord(NamedTuple):
-    r: int
-    c: int
-
-    def __add__(self, other: tuple) -> Coord:
-        return Coord(r=self.r + other[0], c=self.c + other[1])
+def parse_input(source: Source = FILENAME) -> Grid:
+    return Grid.from_lines(_gen_lines(source)).padded(OUTSIDE)
 
 
 class Vector(NamedTuple):
@@ -78,62 +50,88 @@ class Dir(Enum):
         return cls(vector.turn)
 
 
+DIR_CODES: dict[Dir, int] = {dir_: i for i, dir_ in enumerate(Dir)}
+MIRROR_TURNS: dict[int, dict[Dir, Dir]] = {
+    FSLANT: {Dir.E: Dir.N, Dir.N: Dir.E, Dir.S: Dir.W, Dir.W: Dir.S},
+    BSLANT: {Dir.E: Dir.S, Dir.S: Dir.E, Dir.N: Dir.W, Dir.W: Dir.N},
+}
+SPLIT_TURNS: dict[Dir, tuple[Dir, Dir]] = {
+    dir_: (Dir.turn(dir_.value), Dir.opposite(Dir.turn(dir_.value).value)) for dir_ in Dir
+}
+
+
 class Beam:
-    def __init__(self, coord: Coord, dir_: Dir):
-        self.coord = coord
+    __slots__ = ("loc", "width", "_dir", "step", "code")
+
+    def __init__(self, loc: int, dir_: Dir, width: int):
+        self.loc = loc
+        self.width = width
         self.dir = dir_
 
-    def move(self) -> Coord:
-        self.coord += self.dir.value
-        return self.coord
+    @property
+    def dir(self) -> Dir:
+        return self._dir
+
+    @dir.setter
+    def dir(self, dir_: Dir) -> None:
+        self._dir = dir_
+        self.step = dir_.value.v * self.width + dir_.value.h
+        self.code = DIR_CODES[dir_]
+
+    def state(self) -> int:
+        # the tile and direction packed into one int, cheaper to hash than a tuple
+        return self.loc << 2 | self.code
 
-    def process_field(self, field: str) -> Beam | None:
+    def move(self) -> int:
+        self.loc += self.step
+        return self.loc
+
+    def process_field(self, field: int) -> Beam | None:
         if field == EMPTY:
             return None
         if field in SPLITTERS:
             return self._process_splitter(field)
         if field in MIRRORS:
             return self._process_mirror(field)  # type: ignore[func-returns-value]
-        raise Exception(f"Unknown field: {field}")
-
-    def _process_mirror(self, mirror: str) -> None:
-        mapping: dict[str, dict[Dir, Dir]] = {
-            FSLANT: {Dir.E: Dir.N, Dir.N: Dir.E, Dir.S: Dir.W, Dir.W: Dir.S},
-            BSLANT: {Dir.E: Dir.S, Dir.S: Dir.E, Dir.N: Dir.W, Dir.W: Dir.N},
-        }
-        new_dir = mapping[mirror][self.dir]
-        self.dir = new_dir
+        raise Exception(f"Unknown field: {chr(field)}")
+
+    def _process_mirror(self, mirror: int) -> None:
+        self.dir = MIRROR_TURNS[mirror][self.dir]
         return None
 
-    def _process_splitter(self, splitter: str) -> Beam | None:
+    def _process_splitter(self, splitter: int) -> Beam | None:
         if (self.dir in (Dir.N, Dir.S) and splitter == VSPLIT) or (self.dir in (Dir.E, Dir.W) and splitter == HSPLIT):
             return None
-        turned: Dir = self.dir.turn(self.dir.value)
-        turned_opposite: Dir = turned.opposite(turned.value)
+        turned, turned_opposite = SPLIT_TURNS[self.dir]
         self.dir = turned
-        return Beam(self.coord, turned_opposite)
+        return Beam(self.loc, turned_opposite, self.width)
 
     def __repr__(self):
-        return f"{self.__class__.__name__} at {self.coord} moving in direction {self.dir}"
+        return f"{self.__class__.__name__} at {self.loc} moving in direction {self.dir}"
 
 
-@timer
-def part1() -> int:
-    energized: set[Coord] = set()
-    beams: deque[Beam] = deque([Beam(Coord(0, -1), Dir.E)])
-    activated_splitters: set[Coord] = set()
-    contraption, _ = parse_input()
+def part1(contraption: Source | Grid = FILENAME) -> int:
+    contraption = resolve(contraption, parse_input)
+    cells = contraption.cells
+    energized: set[int] = set()
+    beams: deque[Beam] = deque([Beam(contraption.index(1, 0), Dir.E, contraption.width)])
+    activated_splitters: set[int] = set()
+    visited: set[int] = set()
 
     while beams:
         curr_beam = beams.pop()
         while True:
             loc = curr_beam.move()
-            if loc not in contraption:
+            field = cells[loc]
+            if field == OUTSIDE:
                 break
             energized.add(loc)
-            field = contraption[loc]
             if field == EMPTY:
                 continue
+            state = curr_beam.state()
+            if state in visited:
+                break
+            visited.add(state)
             new_beam = curr_beam.process_field(field)
             if new_beam:
                 if loc in activated_splitters:
@@ -144,39 +142,45 @@ def part1() -> int:
     return len(energized)
 
 
-def get_starting_locs(nr: int, nc: int) -> dict[Coord, Dir]:
-    res: dict[Coord, Dir] = {}
-    for r in range(nr):
-        res[Coord(r, -1)] = Dir.E
-        res[Coord(r, nc)] = Dir.W
-    for c in range(nc):
-        res[Coord(-1, c)] = Dir.S
-        res[Coord(nr, c)] = Dir.N
+def get_starting_locs(contraption: Grid) -> dict[int, Dir]:
+    nr, nc = contraption.height - 2, contraption.width - 2
+    res: dict[int, Dir] = {}
+    for r in range(1, nr + 1):
+        res[contraption.index(r, 0)] = Dir.E
+        res[contraption.index(r, nc + 1)] = Dir.W
+    for c in range(1, nc + 1):
+        res[contraption.index(0, c)] = Dir.S
+        res[contraption.index(nr + 1, c)] = Dir.N
     return res
 
 
-@timer
-def part2() -> int:
-    contraption, size = parse_input()
-    starting_points = get_starting_locs(size[0], size[1])
+def part2(contraption: Source | Grid = FILENAME) -> int:
+    contraption = resolve(contraption, parse_input)
+    cells = contraption.cells
+    starting_points = get_starting_locs(contraption)
 
     max_energized = 0
 
     for start, direction in starting_points.items():
-        energized: set[Coord] = set()
-        beams: deque[Beam] = deque([Beam(start, direction)])
-        activated_splitters: set[Coord] = set()
+        energized: set[int] = set()
+        beams: deque[Beam] = deque([Beam(start, direction, contraption.width)])
+        activated_splitters: set[int] = set()
+        visited: set[int] = set()
 
         while beams:
             curr_beam = beams.pop()
             while True:
                 loc = curr_beam.move()
-                if loc not in contraption:
+                field = cells[loc]
+                if field == OUTSIDE:
                     break
                 energized.add(loc)
-                field = contraption[loc]
                 if field == EMPTY:
                     continue
+                state = curr_beam.state()
+                if state in visited:
+                    break
+                visited.add(state)
                 new_beam = curr_beam.process_field(field)
                 if new_beam:
                     if loc in activated_splitters:
@@ -187,8 +191,3 @@ def part2() -> int:
         max_energized = max(max_energized, len(energized))
 
     return max_energized
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
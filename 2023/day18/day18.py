@@ -1,51 +1,24 @@
-from time import perf_counter
-from typing import Callable, Iterator
+from pathlib import Path
+from typing import Iterable, Iterator
 
-FILENAME: str = "input.txt"
-DIRS: dict[str, tuple[int, int]] = {"U": (-1, 0), "D": (1, 0), "L": (0, -1), "R": (0, 1)}
-
-
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        total = end - start
-        mult: int = 1000
-        unit: str = "ms"
-        if total >= 1:
-            mult = 1
-            unit = "s"
-        return f"Result = {res}. Execution took {total * mult:.2f} {unit}."
+from aoc.reader import Source, read_lines, resolve
 
-    return wrapper
+FILENAME: Path = Path(__file__).with_name("input.txt")
+DIRS: dict[str, tuple[int, int]] = {"U": (-1, 0), "D": (1, 0), "L": (0, -1), "R": (0, 1)}
 
 
-def _gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
+def _gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
-def parse_input() -> Iterator[tuple[str, int, str]]:
-    for line in _gen_lines():
+def _gen_plan(source: Source = FILENAME) -> Iterator[tuple[str, int, str]]:
+    for line in _gen_lines(source):
         dr, steps, color = line.split()
         yield dr, int(steps), color
 
 
-def get_border(part: int = 1) -> tuple[list[tuple[int, int]], int]:
-    border: list[tuple[int, int]] = [(0, 0)]
-    l_border: int = 0
-    for dr, steps, hex_s in parse_input():
-        if part == 2:
-            dr, steps = decode_hex(hex_s[2:-1])
-        _dir = DIRS[dr]
-        prev = border[-1]
-        pos = prev[0] + _dir[0] * steps, prev[1] + _dir[1] * steps
-        border.append(pos)
-        l_border += steps
-
-    return border[:-1], l_border
+def parse_input(source: Source = FILENAME) -> list[tuple[str, int, str]]:
+    return list(_gen_plan(source))
 
 
 def decode_hex(s: str) -> tuple[str, int]:
@@ -55,25 +28,27 @@ def decode_hex(s: str) -> tuple[str, int]:
     return dr_map[dr], dst
 
 
-def inside_area(border: list[tuple[int, int]]) -> int:
-    area = 0
-    for i, p in enumerate(border[1:]):
-        area += border[i + 1][0] * border[i][1] - border[i + 1][1] * border[i][0]
-    return abs(area // 2)
-
-
-@timer
-def part1() -> int:
-    border, l_border = get_border()
-    return inside_area(border) + l_border // 2 + 1
+def lagoon_size(plan: Iterable[tuple[str, int, str]], part: int = 1) -> int:
+    # shoelace formula accumulated edge by edge, so the border is never stored
+    row, col = 0, 0
+    area: int = 0
+    l_border: int = 0
+    for dr, steps, hex_s in plan:
+        if part == 2:
+            dr, steps = decode_hex(hex_s[2:-1])
+        _dir = DIRS[dr]
+        next_row, next_col = row + _dir[0] * steps, col + _dir[1] * steps
+        area += next_row * col - next_col * row
+        l_border += steps
+        row, col = next_row, next_col
+    return abs(area // 2) + l_border // 2 + 1
 
 
-@timer
-def part2() -> int:
-    border, l_border = get_border(part=2)
-    return inside_area(border) + l_border // 2 + 1
+def part1(plan: Source | Iterable[tuple[str, int, str]] = FILENAME) -> int:
+    plan = resolve(plan, _gen_plan)
+    return lagoon_size(plan)
 
 
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
+def part2(plan: Source | Iterable[tuple[str, int, str]] = FILENAME) -> int:
+    plan = resolve(plan, _gen_plan)
+    return lagoon_size(plan, part=2)
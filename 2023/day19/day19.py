@@ -1,30 +1,16 @@
 from collections import deque
 from dataclasses import dataclass
 from operator import gt, lt
-from time import perf_counter
+from pathlib import Path
 from typing import Callable, Iterator, Self
 
-FILENAME: str = "input.txt"
-OPERS: dict[str, Callable] = {"<": lt, ">": gt}
-
+from aoc.reader import Source, read_lines, resolve
 
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        total = end - start
-        mult: int = 1000
-        unit: str = "ms"
-        if total >= 1:
-            mult = 1
-            unit = "s"
-        return f"Result = {res}. Execution took {total * mult:.2f} {unit}."
-
-    return wrapper
+FILENAME: Path = Path(__file__).with_name("input.txt")
+OPERS: dict[str, Callable] = {"<": lt, ">": gt}
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     x: int
     m: int
@@ -36,14 +22,12 @@ class Product:
         return self.x + self.m + self.a + self.s
 
 
-def _gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
+def _gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
-def parse_input() -> tuple[dict[str, list[str]], list[Product]]:
-    input_gen = _gen_lines()
+def parse_input(source: Source = FILENAME) -> tuple[dict[str, list[str]], list[Product]]:
+    input_gen = _gen_lines(source)
     workflows: dict[str, list[str]] = {}
     for line in input_gen:
         if line == "":
@@ -70,9 +54,9 @@ def process(prod: Product, rule: str) -> str | None:
     return None
 
 
-@timer
-def part1() -> int:
-    workflows, products = parse_input()
+def part1(system: Source | tuple[dict[str, list[str]], list[Product]] = FILENAME) -> int:
+    system = resolve(system, parse_input)
+    workflows, products = system
     status: dict[str, list[Product]] = {"A": [], "R": []}
 
     for product in products:
@@ -99,6 +83,8 @@ def reverse_map(target: str, workflows: dict[str, list[str]]) -> dict[str, str]:
 
 
 class RangePart:
+    __slots__ = ("wf", "x", "m", "a", "s")
+
     def __init__(self, wf: str = "in", x=range(1, 4001), m=range(1, 4001), a=range(1, 4001), s=range(1, 4001)):
         self.wf = wf
         self.x = x
@@ -110,13 +96,16 @@ class RangePart:
     def combinations(self):
         return len(self.x) * len(self.m) * len(self.a) * len(self.s)
 
+    def copy(self) -> Self:
+        return self.__class__(self.wf, self.x, self.m, self.a, self.s)
+
     def get_mod_copy_wf_only(self, wf: str) -> Self:
-        new_inst: Self = self.__class__(**self.__dict__)
-        setattr(new_inst, "wf", wf)
+        new_inst: Self = self.copy()
+        new_inst.wf = wf
         return new_inst
 
     def get_mod_copy(self, rule: str, inverted: bool) -> Self:
-        new_inst: Self = self.__class__(**self.__dict__)
+        new_inst: Self = self.copy()
         param, val, wf = self._get_param_and_val(rule, inverted)
         if not inverted:
             setattr(new_inst, "wf", wf)
@@ -137,12 +126,12 @@ class RangePart:
         return param, val, wf
 
     def __repr__(self):
-        return ", ".join([f"{k}={v}" for k, v in self.__dict__.items()]) + f" Total = {self.combinations}"
+        return ", ".join([f"{k}={getattr(self, k)}" for k in self.__slots__]) + f" Total = {self.combinations}"
 
 
-@timer
-def part2() -> int:
-    workflows, _ = parse_input()
+def part2(system: Source | tuple[dict[str, list[str]], list[Product]] = FILENAME) -> int:
+    system = resolve(system, parse_input)
+    workflows, _ = system
     total: int = 0
     queue: deque[RangePart] = deque([RangePart()])
 
@@ -164,8 +153,3 @@ def part2() -> int:
                     queue.append(curr_part.get_mod_copy_wf_only(wf=rule))
                     break
     return total
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
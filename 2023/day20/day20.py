@@ -1,26 +1,12 @@
 from abc import ABC, abstractmethod
 from collections import defaultdict, deque
 from math import lcm
-from time import perf_counter
-from typing import Callable, Iterator
+from pathlib import Path
+from typing import Iterator
 
-FILENAME: str = "input.txt"
+from aoc.reader import Source, read_lines, resolve
 
-
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        total = end - start
-        mult: int = 1000
-        unit: str = "ms"
-        if total >= 1:
-            mult = 1
-            unit = "s"
-        return f"Result = {res}. Execution took {total * mult:.2f} {unit}."
-
-    return wrapper
+FILENAME: Path = Path(__file__).with_name("input.txt")
 
 
 class Module(ABC):
@@ -88,24 +74,29 @@ class Conjunction(Module):
         )
 
 
-def _gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
+def _gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
-def parse_input() -> dict[str, Module]:
-    res: dict[str, Module] = {}
-    for line in _gen_lines():
+def parse_input(source: Source = FILENAME) -> list[tuple[str, list[str]]]:
+    config: list[tuple[str, list[str]]] = []
+    for line in _gen_lines(source):
         typename, targets = line.split(" -> ")
+        config.append((typename, targets.split(", ")))
+    return config
+
+
+def create_modules(config: list[tuple[str, list[str]]]) -> dict[str, Module]:
+    res: dict[str, Module] = {}
+    for typename, targets in config:
         if typename == "broadcaster":
-            res[typename] = Broadcaster(targets=targets.split(", "))
+            res[typename] = Broadcaster(targets=targets)
             continue
         type_, name = typename[0], typename[1:]
         if type_ not in "%&":
             raise Exception("Unknown module type.")
         module_class = FlipFlop if type_ == "%" else Conjunction
-        res[name] = module_class(targets=targets.split(", "))
+        res[name] = module_class(targets=targets)
     return res
 
 
@@ -132,9 +123,9 @@ def serialize(mapping: dict[str, Module]) -> str:
     return s
 
 
-@timer
-def part1() -> int:
-    modules = parse_input()
+def part1(config: Source | list[tuple[str, list[str]]] = FILENAME) -> int:
+    config = resolve(config, parse_input)
+    modules = create_modules(config)
     modules = update_conjunction_modules(modules)
 
     pushes: int = 1000
@@ -157,9 +148,9 @@ def part1() -> int:
     return counter[0] * counter[1]
 
 
-@timer
-def part2() -> int:
-    modules = parse_input()
+def part2(config: Source | list[tuple[str, list[str]]] = FILENAME) -> int:
+    config = resolve(config, parse_input)
+    modules = create_modules(config)
     modules = update_conjunction_modules(modules)
 
     rx_mod: str = ""
@@ -193,8 +184,3 @@ def part2() -> int:
         n += 1
 
     return lcm(*rx_cycles.values())
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
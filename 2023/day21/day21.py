@@ -1,52 +1,29 @@
-from time import perf_counter
-from typing import Callable, Iterator, TypeAlias
+from pathlib import Path
+from typing import Iterator, TypeAlias
 
-FILENAME: str = "input.txt"
-Numeric: TypeAlias = int | float
-
-
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        total = end - start
-        mult: int = 1000
-        unit: str = "ms"
-        if total >= 1:
-            mult = 1
-            unit = "s"
-        return f"Result = {res}. Execution took {total * mult:.2f} {unit}."
+from aoc.grid import Grid
+from aoc.reader import Source, read_lines, resolve
 
-    return wrapper
+FILENAME: Path = Path(__file__).with_name("input.txt")
+Numeric: TypeAlias = int | float
 
 
-def _gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
+def _gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
-def parse_input() -> tuple[complex, tuple[int, int], set[complex]]:
-    start = None
-    rocks: set[complex] = set()
-    ir, ic = 0, 0
-    for ir, line in enumerate(_gen_lines()):
-        if not start:
-            if "S" in line:
-                start = ir + line.index("S") * 1j
-        for ic, char in enumerate(line):
-            if char == "#":
-                rocks.add(ir + ic * 1j)
+def parse_input(source: Source = FILENAME) -> tuple[complex, tuple[int, int], set[complex]]:
+    garden = Grid.from_lines(_gen_lines(source))
+    start = garden.find(ord("S"))
     if not start:
         raise Exception("Starting position not found - check your input data.")
-    return start, (ir + 1, ic + 1), rocks
+    rocks: set[complex] = {r + c * 1j for r, c in garden.positions(ord("#"))}
+    return start[0] + start[1] * 1j, garden.size, rocks
 
 
-@timer
-def part1() -> int:
-    start, size, rocks = parse_input()
-    steps: int = 64 if FILENAME == "input.txt" else 6
+def part1(garden: Source | tuple[complex, tuple[int, int], set[complex]] = FILENAME, steps: int = 64) -> int:
+    garden = resolve(garden, parse_input)
+    start, size, rocks = garden
     reached: set[complex] = {start}
     dirs: list[complex] = [1j, -1j, -1, 1]
 
@@ -59,9 +36,9 @@ def cmod(loc: complex, size: tuple[int, int]) -> complex:
     return loc.real % size[0] + loc.imag % size[1] * 1j
 
 
-@timer
-def part2() -> int:
-    start, size, rocks = parse_input()
+def part2(garden: Source | tuple[complex, tuple[int, int], set[complex]] = FILENAME) -> int:
+    garden = resolve(garden, parse_input)
+    start, size, rocks = garden
     total_steps: int = 26501365
     base: int = total_steps % size[0]
     cycle: int = size[0]
@@ -80,8 +57,3 @@ def part2() -> int:
     d2 = u2 - 2 * u1 + u0
     n = 26501365 // cycle
     return d2 * n * (n - 1) // 2 + d1 * n + d0
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
@@ -1,65 +1,40 @@
-from collections import defaultdict, deque
-from time import perf_counter
-from typing import Callable, Iterator
+from collections import deque
+from pathlib import Path
+from typing import Iterator
 
-FILENAME: str = "input.txt"
+from aoc.reader import Source, read_lines, resolve
 
-
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        total = end - start
-        mult: int = 1000
-        unit: str = "ms"
-        if total >= 1:
-            mult = 1
-            unit = "s"
-        return f"Result = {res}. Execution took {total * mult:.2f} {unit}."
-
-    return wrapper
+FILENAME: Path = Path(__file__).with_name("input.txt")
 
 
 class Brick:
+    __slots__ = ("footprint", "bottom", "height", "supports", "supported_by", "vertical")
+
     def __init__(self, start: list[int], end: list[int]):
-        self.cubes: list[list[int]] = self._get_cubes(start, end)
+        assert start <= end
+        self.footprint: tuple[tuple[int, int], ...] = tuple(
+            (x, y) for x in range(start[0], end[0] + 1) for y in range(start[1], end[1] + 1)
+        )
+        self.bottom: int = start[2]
+        self.height: int = end[2] - start[2] + 1
         self.supports: set[Brick] = set()
         self.supported_by: set[Brick] = set()
-        self.vertical: bool = False
+        self.vertical: bool = self.height > 1
 
-    def __iter__(self):
-        return iter(self.cubes)
+    @property
+    def top(self) -> int:
+        return self.bottom + self.height - 1
 
-    def __getitem__(self, item):
-        if item == -1:
-            item = len(self.cubes) - 1
-        if item < 0 or item >= len(self.cubes):
-            raise IndexError
-        return self.cubes[item]
+    @property
+    def cubes(self) -> list[list[int]]:
+        return [[x, y, z] for z in range(self.bottom, self.top + 1) for x, y in self.footprint]
 
     def fall(self, by: int) -> None:
-        for i, cube in enumerate(self):
-            self[i][-1] -= by
-
-    def _get_cubes(self, start: list[int], end: list[int]) -> list[list[int]]:
-        assert start <= end
-        if start == end:
-            return [start, end]
-        cubes = [start]
-        diff = [e - s for s, e in zip(start, end)]
-        dr = next(i for i, v in enumerate(diff) if v)
-        if dr == 2:
-            self.vertical = True
-        for _ in range(sum(diff)):
-            cube = cubes[-1][:]
-            cube[dr] += 1
-            cubes.append(cube)
-        assert cubes[-1] == end
-        return cubes
+        self.bottom -= by
 
     def simple_repr(self):
-        return f"{self.__class__.__name__} {self.cubes[0]} ~ {self.cubes[-1]}"
+        cubes = self.cubes
+        return f"{self.__class__.__name__} {cubes[0]} ~ {cubes[-1]}"
 
     def __repr__(self):
         return (
@@ -68,56 +43,53 @@ class Brick:
         )
 
 
-def _gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
+def _gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
-def parse_input() -> list[Brick]:
-    bricks: list[Brick] = []
-    for line in _gen_lines():
+def parse_input(source: Source = FILENAME) -> list[tuple[tuple[int, ...], tuple[int, ...]]]:
+    snapshot: list[tuple[tuple[int, ...], tuple[int, ...]]] = []
+    for line in _gen_lines(source):
         s, e = line.split("~")
-        start = [int(d) for d in s.split(",")]
-        end = [int(d) for d in e.split(",")]
-        bricks.append(Brick(start, end))
-    return bricks
+        start = tuple(int(d) for d in s.split(","))
+        end = tuple(int(d) for d in e.split(","))
+        snapshot.append((start, end))
+    return snapshot
 
 
 def get_shift_and_supports(
-    brick: Brick, lvl_map: dict[tuple[int, ...], int], cube_to_brick: dict[tuple[int, ...], Brick | None]
+    brick: Brick, lvl_map: dict[tuple[int, int], int], top_brick: dict[tuple[int, int], Brick]
 ) -> tuple[int, list[Brick]]:
-    highest_below_brick: dict[int, list[Brick]] = defaultdict(list)
-    for cube in brick:
-        h = lvl_map[tuple(cube[:-1])]
-        if sup := cube_to_brick[(cube[0], cube[1], h)]:
-            highest_below_brick[h].append(sup)
-    max_h: int = max(highest_below_brick) if highest_below_brick else 0
-    z_shift = brick[0][-1] - max_h - 1
+    max_h: int = max(lvl_map.get(xy, 0) for xy in brick.footprint)
+    z_shift = brick.bottom - max_h - 1
     if not max_h:
-        supports = []
-    else:
-        supports = list(set(highest_below_brick[max_h]))
-    return z_shift, supports
-
-
-@timer
-def part1() -> int:
-    bricks = parse_input()
-    bricks.sort(key=lambda b: b[0][-1])
-    lvl_map: dict[tuple[int, ...], int] = defaultdict(int)
-    cube_to_brick: dict[tuple[int, ...], Brick | None] = defaultdict(lambda: None)
+        return z_shift, []
+    supports = {top_brick[xy] for xy in brick.footprint if lvl_map.get(xy, 0) == max_h}
+    return z_shift, list(supports)
+
+
+def settle_bricks(snapshot: list[tuple[tuple[int, ...], tuple[int, ...]]]) -> list[Brick]:
+    bricks: list[Brick] = [Brick(list(start), list(end)) for start, end in snapshot]
+    bricks.sort(key=lambda b: b.bottom)
+    # height of the highest settled cube and the brick it belongs to, per (x, y) column
+    lvl_map: dict[tuple[int, int], int] = {}
+    top_brick: dict[tuple[int, int], Brick] = {}
     for brick in bricks:
-        z_shift, supports = get_shift_and_supports(brick, lvl_map, cube_to_brick)
+        z_shift, supports = get_shift_and_supports(brick, lvl_map, top_brick)
         brick.fall(by=z_shift)
-        if supports:
-            for sup_brick in supports:
-                brick.supported_by.add(sup_brick)
-                sup_brick.supports.add(brick)
-        for cube in brick:
-            xy, z = cube[:-1], cube[-1]
-            lvl_map[tuple(xy)] = z
-            cube_to_brick[tuple(cube)] = brick
+        for sup_brick in supports:
+            brick.supported_by.add(sup_brick)
+            sup_brick.supports.add(brick)
+        top = brick.top
+        for xy in brick.footprint:
+            lvl_map[xy] = top
+            top_brick[xy] = brick
+    return bricks
+
+
+def part1(snapshot: Source | list[tuple[tuple[int, ...], tuple[int, ...]]] = FILENAME) -> int:
+    snapshot = resolve(snapshot, parse_input)
+    bricks = settle_bricks(snapshot)
 
     cnt: int = 0
     for brick in bricks:
@@ -130,23 +102,9 @@ def part1() -> int:
     return cnt
 
 
-@timer
-def part2() -> int:
-    bricks = parse_input()
-    bricks.sort(key=lambda b: b[0][-1])
-    lvl_map: dict[tuple[int, ...], int] = defaultdict(int)
-    cube_to_brick: dict[tuple[int, ...], Brick | None] = defaultdict(lambda: None)
-    for brick in bricks:
-        z_shift, supports = get_shift_and_supports(brick, lvl_map, cube_to_brick)
-        brick.fall(by=z_shift)
-        if supports:
-            for sup_brick in supports:
-                brick.supported_by.add(sup_brick)
-                sup_brick.supports.add(brick)
-        for cube in brick:
-            xy, z = cube[:-1], cube[-1]
-            lvl_map[tuple(xy)] = z
-            cube_to_brick[tuple(cube)] = brick
+def part2(snapshot: Source | list[tuple[tuple[int, ...], tuple[int, ...]]] = FILENAME) -> int:
+    snapshot = resolve(snapshot, parse_input)
+    bricks = settle_bricks(snapshot)
 
     safe_bricks: set[Brick] = set()
     for brick in bricks:
@@ -156,7 +114,7 @@ def part2() -> int:
             if all(len(supported.supported_by) > 1 for supported in brick.supports):
                 safe_bricks.add(brick)
 
-    bricks.sort(key=lambda b: b[-1][-1], reverse=True)
+    bricks.sort(key=lambda b: b.top, reverse=True)
 
     memo: dict[Brick, int] = {brick: 0 for brick in safe_bricks}
 
@@ -178,8 +136,3 @@ def part2() -> int:
         memo[brick] = cnt
 
     return sum(memo.values())
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
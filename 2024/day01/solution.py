@@ -1,54 +1,31 @@
-from time import perf_counter
-from typing import Callable, Iterator
+from pathlib import Path
+from typing import Iterator
 
-FILENAME: str = "input.txt"
+from aoc.reader import Source, read_lines, resolve
 
+FILENAME: Path = Path(__file__).with_name("input.txt")
 
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        total = end - start
-        mult: int = 1000
-        unit: str = "ms"
-        if total >= 1:
-            mult = 1
-            unit = "s"
-        return f"Result = {res}. Execution took {total * mult:.2f} {unit}."
 
-    return wrapper
+def _gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
-def _gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
-
-
-def parse_input() -> tuple[list, list]:
+def parse_input(source: Source = FILENAME) -> tuple[list, list]:
     left, right = [], []
-    for line in _gen_lines():
+    for line in _gen_lines(source):
         ll, *_, rr = line.split(" ")
         left.append(ll)
         right.append(rr)
     return left, right
 
 
-@timer
-def part1() -> int:
-    left, right = parse_input()
-    left.sort()
-    right.sort()
-    return sum(abs(int(ll) - int(rr)) for ll, rr in zip(left, right))
+def part1(lists: Source | tuple[list, list] = FILENAME) -> int:
+    lists = resolve(lists, parse_input)
+    left, right = lists
+    return sum(abs(int(ll) - int(rr)) for ll, rr in zip(sorted(left), sorted(right)))
 
 
-@timer
-def part2() -> int:
-    left, right = parse_input()
+def part2(lists: Source | tuple[list, list] = FILENAME) -> int:
+    lists = resolve(lists, parse_input)
+    left, right = lists
     return sum(int(n) * right.count(n) for n in left)
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
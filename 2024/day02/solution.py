@@ -1,29 +1,23 @@
-from time import perf_counter
-from typing import Callable, Iterator
+from pathlib import Path
+from typing import Iterable, Iterator
 
-FILENAME: str = "input.txt"
+from aoc.mapreduce import LineJob
+from aoc.reader import Source, read_lines, resolve
 
+FILENAME: Path = Path(__file__).with_name("input.txt")
 
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        total = end - start
-        mult: int = 1000
-        unit: str = "ms"
-        if total >= 1:
-            mult = 1
-            unit = "s"
-        return f"Result = {res}. Execution took {total * mult:.2f} {unit}."
 
-    return wrapper
+def _gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
-def _gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
+def _gen_reports(source: Source = FILENAME) -> Iterator[list[int]]:
+    for line in _gen_lines(source):
+        yield [int(n) for n in line.split()]
+
+
+def parse_input(source: Source = FILENAME) -> list[list[int]]:
+    return list(_gen_reports(source))
 
 
 def check_safety(changes: list[int]) -> bool:
@@ -32,11 +26,10 @@ def check_safety(changes: list[int]) -> bool:
     return all(n in valid_pos for n in changes) or all(n in valid_neg for n in changes)
 
 
-@timer
-def part1() -> int:
+def part1(reports: Source | Iterable[list[int]] = FILENAME) -> int:
+    reports = resolve(reports, _gen_reports)
     safe_count: int = 0
-    for line in _gen_lines():
-        levels = [int(n) for n in line.split()]
+    for levels in reports:
         changes = [levels[i + 1] - n for i, n in enumerate(levels[:-1])]
         if check_safety(changes):
             safe_count += 1
@@ -52,11 +45,10 @@ def check_dampened_safety(levels: list[int]) -> bool:
     return False
 
 
-@timer
-def part2() -> int:
+def part2(reports: Source | Iterable[list[int]] = FILENAME) -> int:
+    reports = resolve(reports, _gen_reports)
     safe_count: int = 0
-    for line in _gen_lines():
-        levels = [int(n) for n in line.split()]
+    for levels in reports:
         changes = [levels[i + 1] - n for i, n in enumerate(levels[:-1])]
         if check_safety(changes):
             safe_count += 1
@@ -65,6 +57,13 @@ def part2() -> int:
     return safe_count
 
 
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
+def safe_report(line: str) -> int:
+    levels = [int(n) for n in line.split()]
+    return int(check_safety([levels[i + 1] - n for i, n in enumerate(levels[:-1])]))
+
+
+def dampened_safe_report(line: str) -> int:
+    return int(safe_report(line) or check_dampened_safety([int(n) for n in line.split()]))
+
+
+LINE_JOBS: dict[str, LineJob] = {"part1": LineJob(safe_report), "part2": LineJob(dampened_safe_report)}
@@ -1,35 +1,24 @@
 import re
-from time import perf_counter
-from typing import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
 
-FILENAME: str = "input.txt"
+from aoc.reader import Source, read_lines, resolve
 
+FILENAME: Path = Path(__file__).with_name("input.txt")
 
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        total = end - start
-        mult: int = 1000
-        unit: str = "ms"
-        if total >= 1:
-            mult = 1
-            unit = "s"
-        return f"Result = {res}. Execution took {total * mult:.2f} {unit}."
 
-    return wrapper
+def _gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
-def _gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
+@dataclass(frozen=True)
+class Program:
+    text: str
 
 
-def parse_input() -> str:
-    s: str = "".join(_gen_lines())
-    return s
+def parse_input(source: Source = FILENAME) -> Program:
+    return Program("".join(_gen_lines(source)))
 
 
 def find_instructions(data: str, pattern: str) -> Iterator[re.Match]:
@@ -44,9 +33,8 @@ def multiply(instruction: str) -> int:
     return int(x) * int(y)
 
 
-@timer
-def part1() -> int:
-    data = parse_input()
+def part1(program: Source | Program = FILENAME) -> int:
+    data = resolve(program, parse_input).text
     mul_matches = find_instructions(data, pattern=r"mul\((\d{1,3}),(\d{1,3})\)")
     total: int = sum(multiply(m.group()) for m in mul_matches)
     return total
@@ -68,9 +56,8 @@ def is_enabled(dos: list[int], donts: list[int], pos: int) -> bool:
     return do_closest > dont_closest if dont_closest else True
 
 
-@timer
-def part2() -> int:
-    data = parse_input()
+def part2(program: Source | Program = FILENAME) -> int:
+    data = resolve(program, parse_input).text
     mul_matches = find_instructions(data, pattern=r"mul\((\d{1,3}),(\d{1,3})\)")
     do_matches = find_instructions(data, pattern=r"do\(\)")
     dont_matches = find_instructions(data, pattern=r"don't\(\)")
@@ -78,8 +65,3 @@ def part2() -> int:
     donts = [m.start() for m in dont_matches]
 
     return sum(multiply(m.group()) for m in mul_matches if is_enabled(dos, donts, m.start()))
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
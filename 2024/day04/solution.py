@@ -1,88 +1,50 @@
-from time import perf_counter
-from typing import Callable, Iterator
+from pathlib import Path
+from typing import Iterator
 
-FILENAME: str = "input.txt"
+from aoc.grid import Grid
+from aoc.reader import Source, read_lines, resolve
 
+FILENAME: Path = Path(__file__).with_name("input.txt")
 
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        total = end - start
-        mult: int = 1000
-        unit: str = "ms"
-        if total >= 1:
-            mult = 1
-            unit = "s"
-        return f"Result = {res}. Execution took {total * mult:.2f} {unit}."
 
-    return wrapper
+def _gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
-def _gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
+def parse_input(source: Source = FILENAME) -> Grid:
+    return Grid.from_lines(_gen_lines(source))
 
 
-def parse_input() -> list[str]:
-    data: list[str] = list(_gen_lines())
-    return data
-
-
-def transpose(data: list[str]) -> list[str]:
-    res: list[str] = ["".join(line[i] for line in data) for i in range(len(data[0]))]
-    return res
-
-
-def transpose_diagonally(data: list[str], reversed: bool = False) -> list[str]:
-    diagonals: dict[int, list[str]] = {}
-    for i, row in enumerate(data):
-        for j, char in enumerate(row):
-            diag_index = j - i if reversed else i + j
-            if diag_index not in diagonals:
-                diagonals[diag_index] = []
-            diagonals[diag_index].append(char)
-
-    return ["".join(diagonals[i]) for i in sorted(diagonals.keys())]
-
-
-def count_occurences(data: list[str], word: str) -> int:
+def count_occurences(data: list[bytes], word: bytes) -> int:
     total: int = 0
     for line in data:
         total += line.count(word) + line.count(word[::-1])
     return total
 
 
-@timer
-def part1() -> int:
-    data_regular = parse_input()
-    data_transposed = transpose(data_regular)
-    data_diag_left_to_right = transpose_diagonally(data_regular)
-    data_diag_right_to_left = transpose_diagonally(data_regular, reversed=True)
+def part1(grid: Source | Grid = FILENAME) -> int:
+    grid = resolve(grid, parse_input)
+    data_regular = grid.rows()
+    data_transposed = grid.transpose().rows()
+    data_diag_left_to_right = grid.diagonals(anti=True)
+    data_diag_right_to_left = grid.diagonals()
 
-    word = "XMAS"
+    word = b"XMAS"
     total: int = 0
     for table in [data_regular, data_transposed, data_diag_left_to_right, data_diag_right_to_left]:
         total += count_occurences(table, word)
     return total
 
 
-@timer
-def part2() -> int:
-    table = parse_input()
-    proper_combinations = {"MSMS", "SSMM", "SMSM", "MMSS"}
+def part2(grid: Source | Grid = FILENAME) -> int:
+    grid = resolve(grid, parse_input)
+    table = grid.rows()
+    proper_combinations = {b"MSMS", b"SSMM", b"SMSM", b"MMSS"}
     count: int = 0
-    for c in range(1, len(table[0]) - 1):
-        for r in range(1, len(table) - 1):
-            combination = table[r - 1][c - 1] + table[r - 1][c + 1] + table[r + 1][c - 1] + table[r + 1][c + 1]
-            if combination in proper_combinations and table[r][c] == "A":
+    for c in range(1, grid.width - 1):
+        for r in range(1, grid.height - 1):
+            combination = bytes((table[r - 1][c - 1], table[r - 1][c + 1], table[r + 1][c - 1], table[r + 1][c + 1]))
+            if combination in proper_combinations and table[r][c] == ord("A"):
                 count += 1
 
     return count
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
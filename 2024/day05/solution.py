@@ -1,33 +1,17 @@
-from time import perf_counter
-from typing import Callable, Iterator
+from pathlib import Path
+from typing import Iterator
 
-FILENAME: str = "input.txt"
+from aoc.reader import Source, read_lines, resolve
 
+FILENAME: Path = Path(__file__).with_name("input.txt")
 
-def timer(func: Callable) -> Callable:
-    def wrapper(*args, **kwargs) -> str:
-        start = perf_counter()
-        res = func(*args, **kwargs)
-        end = perf_counter()
-        total = end - start
-        mult: int = 1000
-        unit: str = "ms"
-        if total >= 1:
-            mult = 1
-            unit = "s"
-        return f"Result = {res}. Execution took {total * mult:.2f} {unit}."
 
-    return wrapper
+def _gen_lines(source: Source = FILENAME) -> Iterator[str]:
+    yield from read_lines(source)
 
 
-def _gen_lines() -> Iterator[str]:
-    with open(FILENAME, "r") as file:
-        for line in file:
-            yield line.rstrip()
-
-
-def parse_input() -> tuple[dict[int, set[int]], dict[int, set[int]], list[list[int]]]:
-    gen = _gen_lines()
+def parse_input(source: Source = FILENAME) -> tuple[dict[int, set[int]], dict[int, set[int]], list[list[int]]]:
+    gen = _gen_lines(source)
     after: dict[int, set[int]] = {}
     before: dict[int, set[int]] = {}
     for line in gen:
@@ -66,9 +50,9 @@ def is_correct(update: list[int], after: dict[int, set[int]], before: dict[int,
     return True
 
 
-@timer
-def part1() -> int:
-    after, before, updates = parse_input()
+def part1(manual: Source | tuple[dict[int, set[int]], dict[int, set[int]], list[list[int]]] = FILENAME) -> int:
+    manual = resolve(manual, parse_input)
+    after, before, updates = manual
 
     checksum: int = 0
 
@@ -91,9 +75,9 @@ def get_correct_middle(update: list[int], after: dict[int, set[int]], before: di
     return -10000000
 
 
-@timer
-def part2() -> int:
-    after, before, updates = parse_input()
+def part2(manual: Source | tuple[dict[int, set[int]], dict[int, set[int]], list[list[int]]] = FILENAME) -> int:
+    manual = resolve(manual, parse_input)
+    after, before, updates = manual
 
     checksum: int = 0
 
@@ -102,8 +86,3 @@ def part2() -> int:
             checksum += get_correct_middle(update, after, before)
 
     return checksum
-
-
-if __name__ == "__main__":
-    print(f"Part 1: {part1()}")
-    print(f"Part 2: {part2()}")
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import IO, Any, Iterator
+
+from aoc.bench import format_seconds
+from aoc.days import Day
+from aoc.runner import run_day
+
+MANIFEST_COMMENT: str = "#"
+
+
+@dataclass
+class BatchSummary:
+    inputs: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.inputs / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        failed = f" ({self.failed} failed)" if self.failed else ""
+        return f"{self.inputs} inputs{failed} in {format_seconds(self.seconds)}: {self.throughput:.1f} inputs/s"
+
+
+def collect_inputs(target: str | os.PathLike) -> list[Path]:
+    target = Path(target)
+    if target.is_dir():
+        return sorted(p for p in target.iterdir() if p.is_file() and not p.name.startswith("."))
+    paths: list[Path] = []
+    with open(target) as manifest:
+        for line in manifest:
+            line = line.strip()
+            if line and not line.startswith(MANIFEST_COMMENT):
+                paths.append(target.parent / line)
+    return paths
+
+
+def solve_input(day: Day, path: Path) -> dict[str, Any]:
+    result = run_day(day, use_cache=False, source=path)
+    return {
+        "day": day.label,
+        "input": str(path),
+        "seconds": result.seconds,
+        "parts": {p.part: {"answer": p.answer, "seconds": p.seconds, "error": p.error} for p in result.parts},
+        "failed": result.failed,
+    }
+
+
+def _solve_chunk(day: Day, paths: list[Path]) -> list[dict[str, Any]]:
+    return [solve_input(day, path) for path in paths]
+
+
+def _chunks(paths: list[Path], size: int) -> Iterator[list[Path]]:
+    for i in range(0, len(paths), size):
+        yield paths[i : i + size]
+
+
+def run_batch(
+    day: Day, paths: list[Path], workers: int | None = None, chunksize: int | None = None
+) -> Iterator[dict[str, Any]]:
+    if workers == 1:
+        yield from (solve_input(day, path) for path in paths)
+        return
+    if chunksize is None:
+        chunksize = max(1, len(paths) // (4 * (workers or os.cpu_count() or 1)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_solve_chunk, day, chunk) for chunk in _chunks(paths, chunksize)]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def write_batch(records: Iterator[dict[str, Any]], out: IO[str]) -> BatchSummary:
+    summary = BatchSummary()
+    start = perf_counter()
+    for record in records:
+        out.write(json.dumps(record, default=str) + "\n")
+        out.flush()
+        summary.inputs += 1
+        summary.failed += record["failed"]
+    summary.seconds = perf_counter() - start
+    return summary
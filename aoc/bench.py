@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import gc
+import json
+import statistics
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator
+
+from aoc.days import PARSER, PARTS, Day, load
+
+DEFAULT_WARMUP: int = 1
+DEFAULT_REPEAT: int = 5
+
+
+@dataclass
+class BenchStats:
+    name: str
+    answer: Any
+    warmup: int
+    samples: list[float] = field(default_factory=list)
+
+    @property
+    def repeat(self) -> int:
+        return len(self.samples)
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples)
+
+    @property
+    def p95(self) -> float:
+        if len(self.samples) < 2:
+            return self.samples[0]
+        return statistics.quantiles(self.samples, n=20, method="inclusive")[-1]
+
+    def to_dict(self) -> dict[str, Any]:
+        res = asdict(self)
+        res.update(repeat=self.repeat, min=self.min, median=self.median, mean=self.mean, p95=self.p95)
+        return res
+
+    def __str__(self) -> str:
+        label = self.name if self.answer is None else f"{self.name}: {self.answer}"
+        return (
+            f"{label} | min {format_seconds(self.min)} | median {format_seconds(self.median)} | "
+            f"p95 {format_seconds(self.p95)} | {self.repeat} runs"
+        )
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    return f"{seconds * 1000:.2f} ms"
+
+
+def time_call(func: Callable, *args, **kwargs) -> tuple[Any, float]:
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = perf_counter()
+        res = func(*args, **kwargs)
+        end = perf_counter()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return res, end - start
+
+
+def benchmark(
+    func: Callable, *args, warmup: int = DEFAULT_WARMUP, repeat: int = DEFAULT_REPEAT, name: str = "", **kwargs
+) -> BenchStats:
+    if repeat < 1:
+        raise ValueError(f"{repeat = }. At least one timed run is required.")
+    for _ in range(warmup):
+        func(*args, **kwargs)
+    stats = BenchStats(name=name or func.__name__, answer=None, warmup=warmup)
+    for _ in range(repeat):
+        stats.answer, elapsed = time_call(func, *args, **kwargs)
+        stats.samples.append(elapsed)
+    return stats
+
+
+def bench_day(
+    day: Day,
+    warmup: int = DEFAULT_WARMUP,
+    repeat: int = DEFAULT_REPEAT,
+    use_cache: bool = False,
+    parts: Iterable[str] = PARTS,
+) -> Iterator[BenchStats]:
+    from aoc.cache import load_parsed, parsed_cache
+
+    module = load(day)
+    cache = parsed_cache() if use_cache else None
+    name = f"{day.label} {PARSER}" + (" (cached)" if use_cache else "")
+    parsing = benchmark(load_parsed, day, module, cache, warmup=warmup, repeat=repeat, name=name)
+    (data, _), parsing.answer = parsing.answer, None
+    yield parsing
+    for part in parts:
+        yield benchmark(getattr(module, part), data, warmup=warmup, repeat=repeat, name=f"{day.label} {part}")
+
+
+def dump_json(stats: Iterable[BenchStats], path: str) -> None:
+    with open(path, "w") as file:
+        json.dump([s.to_dict() for s in stats], file, indent=2)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from aoc.days import PARSER, ROOT, Day
+from aoc.reader import Source, read_bytes
+
+CACHE_DIR: Path = Path(os.environ.get("AOC_CACHE_DIR", ROOT / ".cache"))
+DEFAULT_MAX_BYTES: int = int(os.environ.get("AOC_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+ANSWERS_MAX_BYTES: int = int(os.environ.get("AOC_ANSWER_CACHE_MAX_BYTES", 16 * 1024 * 1024))
+SUFFIX: str = ".pickle"
+
+
+class DiskCache:
+    def __init__(self, namespace: str, max_bytes: int = DEFAULT_MAX_BYTES, directory: Path = CACHE_DIR):
+        self.directory = directory / namespace
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(*parts: bytes | str) -> str:
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"py{sys.version_info[0]}.{sys.version_info[1]}".encode())
+        for part in parts:
+            data = part.encode() if isinstance(part, str) else part
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{SUFFIX}"
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return False, None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            path.unlink(missing_ok=True)
+            return False, None
+        os.utime(path)
+        return True, value
+
+    def put(self, key: str, value: Any) -> None:
+        # the cache only saves work, so a write that fails is dropped instead of failing the caller
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            Path(tmp).unlink(missing_ok=True)
+            return
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for path in self.directory.glob(f"*{SUFFIX}"):
+            # another process may evict the same entry between the glob and the stat
+            try:
+                entries.append((path.stat(), path))
+            except FileNotFoundError:
+                continue
+        total = sum(st.st_size for st, _ in entries)
+        for st, path in sorted(entries, key=lambda e: e[0].st_mtime):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+
+    def clear(self) -> None:
+        for path in self.directory.glob(f"*{SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+
+def parsed_cache() -> DiskCache:
+    return DiskCache("parsed")
+
+
+def answer_cache() -> DiskCache:
+    return DiskCache("answers", ANSWERS_MAX_BYTES)
+
+
+def solver_sources(module: ModuleType) -> list[bytes]:
+    helpers: set[str] = set()
+    for value in vars(module).values():
+        name = value.__name__ if isinstance(value, ModuleType) else getattr(value, "__module__", None)
+        if isinstance(name, str) and name.startswith("aoc."):
+            helpers.add(name)
+    paths = [Path(module.__file__ or "")] + [Path(sys.modules[name].__file__ or "") for name in sorted(helpers)]
+    return [path.read_bytes() for path in paths]
+
+
+def answer_key(cache: DiskCache, module: ModuleType, content: bytes) -> str:
+    return cache.key("answers", *solver_sources(module), content)
+
+
+def load_parsed(
+    day: Day, module: ModuleType, cache: DiskCache | None = None, source: Source | None = None
+) -> tuple[Any, bool]:
+    parser = getattr(module, PARSER)
+    source = day.input_path if source is None else source
+    if cache is None:
+        return parser(source), False
+    content = read_bytes(source)
+    # parsed data pickles classes from the aoc helpers too, so their sources are part of the key
+    key = cache.key(PARSER, *solver_sources(module), content)
+    found, data = cache.get(key)
+    if not found:
+        data = parser(content)
+        cache.put(key, data)
+    return data, found
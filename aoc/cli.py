@@ -0,0 +1,435 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import textwrap
+from time import perf_counter
+
+from aoc.batch import collect_inputs, run_batch, write_batch
+from aoc.bench import DEFAULT_REPEAT, DEFAULT_WARMUP, bench_day, dump_json, format_seconds
+from aoc.complexity import COMPLEXITY_SCALES, analyze
+from aoc.days import PARTS, discover, find, load
+from aoc.fuzz import DEFAULT_RUNS, PAIRS, fuzz_all
+from aoc.generators import generate, has_generator
+from aoc.history import (
+    DEFAULT_ALPHA,
+    DEFAULT_HISTORY,
+    DEFAULT_THRESHOLD,
+    commits,
+    compare,
+    read_history,
+    record,
+    samples_for,
+)
+from aoc.mapreduce import DEFAULT_CHUNK_BYTES, line_jobs, map_lines
+from aoc.memory import DEFAULT_TOLERANCE, check, compare_revision, dump_stats, format_change, load_baseline, memory_day
+from aoc.runner import format_table, run_day, run_days
+from aoc.scaling import DEFAULT_BUDGET, DEFAULT_SCALES, dump_points, plot_points, scale_day
+from aoc.startup import CLI_BUDGET, startup_day, startup_module
+from aoc.startup import DEFAULT_BUDGET as STARTUP_BUDGET
+from aoc.watch import DEFAULT_INTERVAL, watch_day
+from aoc.watch import DEFAULT_REPEAT as WATCH_REPEAT
+
+
+def _add_selection(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("-y", "--year", type=int, action="append", help="year(s) to include, default: all")
+    parser.add_argument("-d", "--day", type=int, action="append", help="day(s) to include, default: all")
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    days = discover(args.year, args.day)
+    if not days:
+        print("No matching days found.", file=sys.stderr)
+        return 1
+    start = perf_counter()
+    results = list(
+        run_days(
+            days,
+            workers=args.workers,
+            use_cache=not args.no_cache,
+            threads=args.threads,
+            profile=args.profile,
+            sample=args.sample,
+            rerun=args.rerun,
+        )
+    )
+    wall = perf_counter() - start
+    print(format_table(results))
+    cpu = sum(r.seconds for r in results)
+    solved = sum(not r.skipped for r in results)
+    cached = sum(r.cached for r in results)
+    print(
+        f"\n{solved} days solved ({cached} from the answer cache) in {format_seconds(wall)} wall clock "
+        f"({format_seconds(cpu)} in solvers)."
+    )
+    return 1 if any(r.failed for r in results) else 0
+
+
+def cmd_solve(args: argparse.Namespace) -> int:
+    try:
+        day = find(args.year, args.day)
+    except LookupError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    source = sys.stdin.buffer if args.input == "-" else args.input
+    if args.part is None:
+        result = run_day(day, use_cache=not args.no_cache, source=source)
+        print(format_table([result]))
+        return 1 if result.failed else 0
+    solver = getattr(load(day), args.part, None)
+    if not args.part.startswith("part") or not callable(solver):
+        print(f"{day.label} has no part named {args.part!r}.", file=sys.stderr)
+        return 1
+    start = perf_counter()
+    answer = solver(source)
+    print(f"{day.label} {args.part}: {answer} in {format_seconds(perf_counter() - start)}")
+    return 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    days = [day for day in discover(args.year, args.day) if day.input_path.is_file()]
+    if not days:
+        print("No matching days with input found.", file=sys.stderr)
+        return 1
+    results = []
+    for day in days:
+        parts = args.part or PARTS
+        for stats in bench_day(day, warmup=args.warmup, repeat=args.repeat, use_cache=args.cached, parts=parts):
+            print(stats)
+            results.append(stats)
+    if args.json:
+        dump_json(results, args.json)
+    if args.record:
+        commit = record(results, args.history)
+        print(f"Recorded {len(results)} results for {commit} in {args.history}.", file=sys.stderr)
+    return 0
+
+
+def cmd_compare(args: argparse.Namespace) -> int:
+    try:
+        entries = read_history(args.history)
+    except FileNotFoundError:
+        print(f"No benchmark history at {args.history}, run bench --record first.", file=sys.stderr)
+        return 1
+    recorded = commits(entries)
+    candidate = args.candidate or (recorded[-1] if recorded else None)
+    baseline = args.baseline or next((c for c in reversed(recorded) if c != candidate), None)
+    if candidate not in recorded or baseline not in recorded:
+        print(f"Need two recorded commits to compare, history has: {', '.join(recorded) or 'none'}.", file=sys.stderr)
+        return 1
+    print(f"{baseline} -> {candidate}")
+    changes = list(compare(samples_for(entries, baseline), samples_for(entries, candidate), args.alpha, args.threshold))
+    for change in changes:
+        print(change)
+    slower = sum(c.significant for c in changes)
+    print(f"\n{slower} of {len(changes)} parts significantly slower.")
+    return 1 if slower and args.strict else 0
+
+
+def cmd_memory(args: argparse.Namespace) -> int:
+    days = [day for day in discover(args.year, args.day) if day.input_path.is_file()]
+    if not days:
+        print("No matching days with input found.", file=sys.stderr)
+        return 1
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    max_rss = args.max_rss * 1024**2 if args.max_rss is not None else None
+    max_traced = args.max_traced * 1024**2 if args.max_traced is not None else None
+    results, problems = [], []
+    for day in days:
+        if args.against:
+            try:
+                pairs = list(compare_revision(day, args.against))
+            except LookupError as exc:
+                print(exc, file=sys.stderr)
+                return 1
+            for old, stats in pairs:
+                print(format_change(old, stats))
+                results.append(stats)
+                problems += check(stats, baseline, args.tolerance, max_rss, max_traced)
+            continue
+        for stats in memory_day(day):
+            print(stats)
+            results.append(stats)
+            problems += check(stats, baseline, args.tolerance, max_rss, max_traced)
+    if args.json:
+        dump_stats(results, args.json)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    try:
+        day = find(args.year, args.day)
+    except LookupError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    paths = collect_inputs(args.inputs)
+    records = run_batch(day, paths, workers=args.workers, chunksize=args.chunksize)
+    if args.output == "-":
+        summary = write_batch(records, sys.stdout)
+    else:
+        with open(args.output, "w") as out:
+            summary = write_batch(records, out)
+    print(summary, file=sys.stderr)
+    return 1 if summary.failed else 0
+
+
+def cmd_lines(args: argparse.Namespace) -> int:
+    try:
+        day = find(args.year, args.day)
+    except LookupError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    parts = args.part or list(line_jobs(day))
+    if not parts:
+        print(f"{day.label} declares no line-independent parts.", file=sys.stderr)
+        return 1
+    source = args.input or day.input_path
+    for part in parts:
+        start = perf_counter()
+        try:
+            answer = map_lines(day, part, source, workers=args.workers, chunk_bytes=args.chunk_bytes)
+        except LookupError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+        print(f"{day.label} {part}: {answer} in {format_seconds(perf_counter() - start)}")
+    return 0
+
+
+def cmd_watch(args: argparse.Namespace) -> int:
+    try:
+        day = find(args.year, args.day)
+    except LookupError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(f"Watching {day.path.name} and {day.input_path.name}, Ctrl-C to stop.", file=sys.stderr)
+    try:
+        for line in watch_day(day, args.interval, args.warmup, args.repeat):
+            print(line, flush=True)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_fuzz(args: argparse.Namespace) -> int:
+    failed = 0
+    try:
+        for report in fuzz_all(args.pairs, args.runs, args.seed, shrinking=not args.no_shrink):
+            print(report)
+            for failure in report.failures[: args.show]:
+                print(textwrap.indent(str(failure), "  "))
+            failed += bool(report.failures)
+    except LookupError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    return 1 if failed else 0
+
+
+def cmd_generate(args: argparse.Namespace) -> int:
+    try:
+        content = generate(find(args.year, args.day), args.scale, args.seed)
+    except LookupError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    if args.output == "-":
+        sys.stdout.write(content)
+    else:
+        with open(args.output, "w") as out:
+            out.write(content)
+    return 0
+
+
+def cmd_scale(args: argparse.Namespace) -> int:
+    days = [day for day in discover(args.year, args.day) if has_generator(day)]
+    if not days:
+        print("No matching days with an input generator found.", file=sys.stderr)
+        return 1
+    points = []
+    for day in days:
+        for point in scale_day(day, args.scales, args.seed, args.warmup, args.repeat, args.budget, args.part or PARTS):
+            print(point)
+            points.append(point)
+    if args.json:
+        dump_points(points, args.json)
+    if args.plot:
+        plot_points(points, args.plot)
+    return 0
+
+
+def cmd_complexity(args: argparse.Namespace) -> int:
+    days = [day for day in discover(args.year, args.day) if has_generator(day)]
+    if not days:
+        print("No matching days with an input generator found.", file=sys.stderr)
+        return 1
+    worse = 0
+    for day in days:
+        points = list(scale_day(day, args.scales, args.seed, args.warmup, args.repeat, args.budget))
+        for growth in analyze(points):
+            print(growth)
+            worse += growth.worse
+    print(f"\n{worse} parts grow faster than expected.")
+    return 1 if worse and args.strict else 0
+
+
+def cmd_startup(args: argparse.Namespace) -> int:
+    over = 0
+    for startup, budget in [(startup_module(), args.cli_budget)] + [
+        (startup_day(day), args.budget) for day in discover(args.year, args.day)
+    ]:
+        flag = f" <-- over {format_seconds(budget)}" if startup.over(budget) else ""
+        print(f"{startup}{flag}")
+        for heavy in startup.heaviest(args.top):
+            print(f"  {heavy.module}: {format_seconds(heavy.seconds)}")
+        over += startup.over(budget)
+    print(f"\n{over} modules over their startup budget.")
+    return 1 if over else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m aoc", description="Advent of Code solutions runner.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="solve days in a process pool and print answers with timings")
+    _add_selection(run)
+    run.add_argument("-j", "--workers", type=int, default=None, help="worker processes, default: CPU count")
+    run.add_argument("-t", "--threads", action="store_true", help="use a thread pool instead of worker processes")
+    run.add_argument("--no-cache", action="store_true", help="bypass both the answer cache and the parse cache")
+    run.add_argument("--rerun", action="store_true", help="solve every day even if its answers are cached")
+    run.add_argument("--profile", metavar="DIR", help="write cProfile and tracemalloc reports for each day to DIR")
+    run.add_argument("--sample", action="store_true", help="with --profile, also write sampled flamegraph stacks")
+    run.set_defaults(func=cmd_run)
+
+    solve = sub.add_parser("solve", help="solve one day on input read from stdin or a given file")
+    solve.add_argument("-y", "--year", type=int, required=True, help="year of the day to solve")
+    solve.add_argument("-d", "--day", type=int, required=True, help="day to solve")
+    solve.add_argument("input", nargs="?", default="-", help="input file, default: stdin")
+    solve.add_argument(
+        "-p", "--part", help="run only this part, e.g. part1 or part1_vectorized, streaming the input where it can"
+    )
+    solve.add_argument("--no-cache", action="store_true", help="bypass both the answer cache and the parse cache")
+    solve.set_defaults(func=cmd_solve)
+
+    bench = sub.add_parser("bench", help="time each part repeatedly and report min/median/p95")
+    _add_selection(bench)
+    bench.add_argument("-w", "--warmup", type=int, default=DEFAULT_WARMUP, help="untimed runs before measuring")
+    bench.add_argument("-r", "--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per part")
+    bench.add_argument("--json", metavar="PATH", help="also write machine-readable results to PATH")
+    bench.add_argument("-p", "--part", action="append", help="part(s) to time, e.g. part1_vectorized, default: both")
+    bench.add_argument("--cached", action="store_true", help="load parsed input from the parse cache")
+    bench.add_argument("--record", action="store_true", help="append the results for the current commit to the history")
+    bench.add_argument("--history", default=DEFAULT_HISTORY, help="benchmark history file, default: bench_output.txt")
+    bench.set_defaults(func=cmd_bench)
+
+    comp = sub.add_parser("compare", help="flag parts that got significantly slower between two recorded commits")
+    comp.add_argument("--history", default=DEFAULT_HISTORY, help="benchmark history file, default: bench_output.txt")
+    comp.add_argument("-b", "--baseline", help="commit to compare against, default: the one recorded before candidate")
+    comp.add_argument("-c", "--candidate", help="commit to check, default: the last one recorded")
+    comp.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="significance level of the rank-sum test")
+    comp.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="smallest relative slowdown reported")
+    comp.add_argument("--strict", action="store_true", help="exit 1 if any part got significantly slower")
+    comp.set_defaults(func=cmd_compare)
+
+    memory = sub.add_parser("memory", help="report peak RSS, traced memory and allocated blocks per part")
+    _add_selection(memory)
+    memory.add_argument("--json", metavar="PATH", help="also write machine-readable results to PATH")
+    memory.add_argument("--baseline", metavar="PATH", help="fail when a part grows past a previous --json result")
+    memory.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed relative growth over the baseline"
+    )
+    memory.add_argument("--max-rss", type=float, metavar="MB", help="fail when a part's peak RSS exceeds MB")
+    memory.add_argument("--max-traced", type=float, metavar="MB", help="fail when a part's traced peak exceeds MB")
+    memory.add_argument(
+        "--against", metavar="REV", help="measure each part at git revision REV too and print the change to now"
+    )
+    memory.set_defaults(func=cmd_memory)
+
+    batch = sub.add_parser("batch", help="solve many inputs for one day and stream results as JSON lines")
+    batch.add_argument("-y", "--year", type=int, required=True, help="year of the day to run")
+    batch.add_argument("-d", "--day", type=int, required=True, help="day to run")
+    batch.add_argument("inputs", help="directory of input files, or a manifest listing one input path per line")
+    batch.add_argument("-o", "--output", default="-", help="JSONL file to write results to, default: stdout")
+    batch.add_argument("-j", "--workers", type=int, default=None, help="worker processes, default: CPU count")
+    batch.add_argument("-c", "--chunksize", type=int, default=None, help="inputs handed to a worker at a time")
+    batch.set_defaults(func=cmd_batch)
+
+    lines = sub.add_parser("lines", help="solve a line-independent part by mapping chunks of the input over processes")
+    lines.add_argument("-y", "--year", type=int, required=True, help="year of the day to run")
+    lines.add_argument("-d", "--day", type=int, required=True, help="day to run")
+    lines.add_argument("-p", "--part", action="append", help="part(s) to run, default: all declared in LINE_JOBS")
+    lines.add_argument("input", nargs="?", help="input file, default: the day's input.txt")
+    lines.add_argument("-j", "--workers", type=int, default=None, help="worker processes, default: CPU count")
+    lines.add_argument(
+        "-c", "--chunk-bytes", type=int, default=DEFAULT_CHUNK_BYTES, help="bytes handed to a worker at a time"
+    )
+    lines.set_defaults(func=cmd_lines)
+
+    watch = sub.add_parser("watch", help="re-run and re-time the parts of one day whenever its code or input changes")
+    watch.add_argument("-y", "--year", type=int, required=True, help="year of the day to watch")
+    watch.add_argument("-d", "--day", type=int, required=True, help="day to watch")
+    watch.add_argument("-i", "--interval", type=float, default=DEFAULT_INTERVAL, help="seconds between checks")
+    watch.add_argument("-w", "--warmup", type=int, default=0, help="untimed runs before measuring")
+    watch.add_argument("-r", "--repeat", type=int, default=WATCH_REPEAT, help="timed runs per changed part")
+    watch.set_defaults(func=cmd_watch)
+
+    fz = sub.add_parser("fuzz", help="compare optimized parts against reference implementations on generated inputs")
+    fz.add_argument("pairs", nargs="*", help=f"pairs to check, default: all of {', '.join(PAIRS)}")
+    fz.add_argument("-n", "--runs", type=int, default=DEFAULT_RUNS, help="generated inputs per pair")
+    fz.add_argument("--seed", type=int, default=0, help="first random seed, default: 0")
+    fz.add_argument("--show", type=int, default=3, help="counterexamples printed per pair")
+    fz.add_argument("--no-shrink", action="store_true", help="report disagreeing inputs without shrinking them")
+    fz.set_defaults(func=cmd_fuzz)
+
+    gen = sub.add_parser("generate", help="write a synthetic input for one day")
+    gen.add_argument("-y", "--year", type=int, required=True, help="year of the day to generate")
+    gen.add_argument("-d", "--day", type=int, required=True, help="day to generate")
+    gen.add_argument("-s", "--scale", type=float, default=1.0, help="size relative to a real input, default: 1")
+    gen.add_argument("--seed", type=int, default=0, help="random seed, default: 0")
+    gen.add_argument("-o", "--output", default="-", help="file to write the input to, default: stdout")
+    gen.set_defaults(func=cmd_generate)
+
+    scale = sub.add_parser("scale", help="time each part on generated inputs of growing size")
+    _add_selection(scale)
+    scale.add_argument("-s", "--scales", type=float, nargs="+", default=DEFAULT_SCALES, help="input scale factors")
+    scale.add_argument("-p", "--part", action="append", help="part(s) to time, e.g. part1_vectorized, default: both")
+    scale.add_argument("--seed", type=int, default=0, help="random seed, default: 0")
+    scale.add_argument("-w", "--warmup", type=int, default=0, help="untimed runs before measuring")
+    scale.add_argument("-r", "--repeat", type=int, default=1, help="timed runs per part and size")
+    scale.add_argument(
+        "--budget", type=float, default=DEFAULT_BUDGET, help="stop growing a day once a part takes longer (seconds)"
+    )
+    scale.add_argument("--json", metavar="PATH", help="also write machine-readable results to PATH")
+    scale.add_argument("--plot", metavar="PATH", help="plot runtime against input size per day to PATH")
+    scale.set_defaults(func=cmd_scale)
+
+    complexity = sub.add_parser("complexity", help="fit how each part's runtime grows with input size")
+    _add_selection(complexity)
+    complexity.add_argument(
+        "-s", "--scales", type=float, nargs="+", default=COMPLEXITY_SCALES, help="input scale factors"
+    )
+    complexity.add_argument("--seed", type=int, default=0, help="random seed, default: 0")
+    complexity.add_argument("-w", "--warmup", type=int, default=0, help="untimed runs before measuring")
+    complexity.add_argument("-r", "--repeat", type=int, default=3, help="timed runs per part and size, min is kept")
+    complexity.add_argument(
+        "--budget", type=float, default=DEFAULT_BUDGET, help="stop growing a day once a part takes longer (seconds)"
+    )
+    complexity.add_argument("--strict", action="store_true", help="exit 1 if any part grows faster than expected")
+    complexity.set_defaults(func=cmd_complexity)
+
+    startup = sub.add_parser("startup", help="time a cold import of the CLI and of each day in a fresh interpreter")
+    _add_selection(startup)
+    startup.add_argument(
+        "--budget", type=float, default=STARTUP_BUDGET, help="seconds a day may take to load, exit 1 if exceeded"
+    )
+    startup.add_argument(
+        "--cli-budget", type=float, default=CLI_BUDGET, help="seconds importing aoc.cli may take, exit 1 if exceeded"
+    )
+    startup.add_argument("--top", type=int, default=3, help="heaviest imports listed per module")
+    startup.set_defaults(func=cmd_startup)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
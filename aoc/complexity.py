@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+from aoc.bench import format_seconds
+from aoc.scaling import ScalePoint
+
+MODELS: dict[str, Callable[[float], float]] = {
+    "1": lambda n: 1.0,
+    "log n": lambda n: math.log(n),
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log(n),
+    "n^1.5": lambda n: n**1.5,
+    "n^2": lambda n: n**2,
+    "n^3": lambda n: n**3,
+}
+RANKS: dict[str, int] = {name: i for i, name in enumerate(MODELS)}
+COMPLEXITY_SCALES: tuple[float, ...] = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0)
+DEFAULT_EXPECTED: str = "n log n"
+EXPECTED: dict[str, str] = {
+    # every edge tile starts a beam that can cross the whole grid
+    "2023/16 part2": "n^1.5",
+    # the number of steps grows with the side of the garden, the reached area with its square
+    "2023/21 part2": "n^1.5",
+}
+MIN_POINTS: int = 3
+# a simpler model wins unless a more complex one cuts the log-space error by this factor
+SIMPLICITY_MARGIN: float = 1.5
+
+
+@dataclass
+class Fit:
+    model: str
+    coefficient: float
+    error: float
+
+
+@dataclass
+class Growth:
+    name: str
+    sizes: list[int]
+    seconds: list[float]
+    fits: list[Fit]
+    expected: str
+
+    @property
+    def best(self) -> Fit | None:
+        return _pick(self.fits)
+
+    @property
+    def slope(self) -> float | None:
+        if len(self.sizes) < 2:
+            return None
+        xs = [math.log(n) for n in self.sizes]
+        ys = [math.log(t) for t in self.seconds]
+        mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+        var = sum((x - mx) ** 2 for x in xs)
+        return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var if var else None
+
+    @property
+    def worse(self) -> bool:
+        best = self.best
+        return best is not None and RANKS[best.model] > RANKS[self.expected]
+
+    def __str__(self) -> str:
+        best = self.best
+        if best is None:
+            return f"{self.name}: n/a, only {len(self.sizes)} sizes measured"
+        flag = " <-- worse than expected" if self.worse else ""
+        return (
+            f"{self.name}: O({best.model}), slope {self.slope:.2f}, expected O({self.expected}), "
+            f"{format_seconds(self.seconds[-1])} at {self.sizes[-1]} bytes{flag}"
+        )
+
+
+def fit(sizes: list[int], seconds: list[float]) -> list[Fit]:
+    fits: list[Fit] = []
+    logs = [math.log(max(t, 1e-9)) for t in seconds]
+    for name, func in MODELS.items():
+        shapes = [math.log(func(n)) for n in sizes]
+        log_c = sum(t - s for t, s in zip(logs, shapes)) / len(sizes)
+        error = math.sqrt(sum((t - s - log_c) ** 2 for t, s in zip(logs, shapes)) / len(sizes))
+        fits.append(Fit(name, math.exp(log_c), error))
+    return fits
+
+
+def _pick(fits: list[Fit]) -> Fit | None:
+    if not fits:
+        return None
+    best = fits[0]
+    for candidate in fits[1:]:
+        if candidate.error * SIMPLICITY_MARGIN < best.error:
+            best = candidate
+    return best
+
+
+def analyze(points: Iterable[ScalePoint]) -> Iterator[Growth]:
+    points = list(points)
+    if not points:
+        return
+    day = points[0].day
+    sizes = [p.size for p in points]
+    for i, stats in enumerate(points[0].stats):
+        name = f"{day.label} {stats.name}"
+        seconds = [p.stats[i].min for p in points]
+        fits = fit(sizes, seconds) if len(points) >= MIN_POINTS else []
+        yield Growth(name, sizes, seconds, fits, EXPECTED.get(name, DEFAULT_EXPECTED))
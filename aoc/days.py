@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import importlib.util
+import re
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Iterable
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+INPUT_FILENAME: str = "input.txt"
+PARSER: str = "parse_input"
+PARTS: tuple[str, ...] = ("part1", "part2")
+_YEAR_PATTERN = re.compile(r"\d{4}")
+_DAY_PATTERN = re.compile(r"day(\d{2})")
+_NON_WORD = re.compile(r"\W")
+_LOAD_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, order=True)
+class Day:
+    year: int
+    day: int
+    path: Path
+
+    @property
+    def label(self) -> str:
+        return f"{self.year}/{self.day:02d}"
+
+    @property
+    def directory(self) -> Path:
+        return self.path.parent
+
+    @property
+    def input_path(self) -> Path:
+        return self.directory / INPUT_FILENAME
+
+    @property
+    def module_name(self) -> str:
+        return f"aoc_{self.year}_day{self.day:02d}"
+
+
+def _find_solution(directory: Path) -> Path | None:
+    for name in (f"{directory.name}.py", "solution.py"):
+        if (directory / name).is_file():
+            return directory / name
+    return None
+
+
+def discover(years: Iterable[int] | None = None, days: Iterable[int] | None = None) -> list[Day]:
+    wanted_years = set(years) if years else None
+    wanted_days = set(days) if days else None
+    found: list[Day] = []
+    for year_dir in ROOT.iterdir():
+        if not year_dir.is_dir() or not _YEAR_PATTERN.fullmatch(year_dir.name):
+            continue
+        year = int(year_dir.name)
+        if wanted_years and year not in wanted_years:
+            continue
+        for day_dir in year_dir.iterdir():
+            if not (m := _DAY_PATTERN.fullmatch(day_dir.name)):
+                continue
+            day = int(m.group(1))
+            if wanted_days and day not in wanted_days:
+                continue
+            if path := _find_solution(day_dir):
+                found.append(Day(year, day, path))
+    return sorted(found)
+
+
+def find(year: int, day: int) -> Day:
+    matches = discover([year], [day])
+    if not matches:
+        raise LookupError(f"No solution found for {year} day {day}.")
+    return matches[0]
+
+
+def load(day: Day) -> ModuleType:
+    if day.module_name in sys.modules:
+        return sys.modules[day.module_name]
+    with _LOAD_LOCK:
+        if day.module_name in sys.modules:
+            return sys.modules[day.module_name]
+        return _exec(day)
+
+
+def _exec(day: Day) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(day.module_name, day.path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[day.module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[day.module_name]
+        raise
+    return module
+
+
+def reload(day: Day) -> ModuleType:
+    with _LOAD_LOCK:
+        previous = sys.modules.pop(day.module_name, None)
+        try:
+            return _exec(day)
+        except BaseException:
+            if previous is not None:
+                sys.modules[day.module_name] = previous
+            raise
+
+
+def load_revision(day: Day, revision: str) -> ModuleType:
+    relative = day.path.resolve().relative_to(ROOT).as_posix()
+    try:
+        source = subprocess.run(
+            ["git", "show", f"{revision}:{relative}"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError) as exc:
+        raise LookupError(f"Cannot read {relative} at {revision}.") from exc
+    # the old code still resolves its FILENAME next to the current file, so both versions read the same input
+    module = ModuleType(f"{day.module_name}_at_{_NON_WORD.sub('_', revision)}")
+    module.__file__ = str(day.path)
+    sys.modules[module.__name__] = module
+    try:
+        exec(compile(source, f"{revision}:{relative}", "exec"), module.__dict__)
+    except BaseException:
+        del sys.modules[module.__name__]
+        raise
+    return module
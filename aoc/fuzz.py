@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import random
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+from aoc.bench import format_seconds, time_call
+from aoc.days import PARSER, find, load
+from aoc.generators import Generator, generate
+from aoc.generators.y2023 import ALMANAC, almanac
+
+DEFAULT_RUNS: int = 100
+MAX_SHRINK_STEPS: int = 2000
+_INTEGER = re.compile(r"\d+")
+
+
+def _complete_almanac(text: str) -> bool:
+    seeds, *sections = text.split("\n\n")
+    lengths = seeds.split()[2::2]
+    if len(sections) != len(ALMANAC) - 1 or not lengths:
+        return False
+    for section in sections:
+        header, *rows = section.strip().splitlines()
+        if not header.endswith(" map:") or not rows or any(len(row.split()) != 3 for row in rows):
+            return False
+        lengths += [row.split()[2] for row in rows]
+    return all(int(n) > 0 for n in lengths)
+
+
+def _small_almanac(rng: random.Random, scale: float) -> str:
+    # the brute force walks every seed, so the generated numbers are kept in the hundreds
+    return almanac(rng, scale, limit=1000)
+
+
+@dataclass(frozen=True)
+class Pair:
+    year: int
+    day: int
+    reference: str
+    candidate: str
+    scale: float = 0.05
+    generator: Generator | None = None
+    # inputs the puzzle rules out, which the two implementations may legitimately disagree on
+    valid: Callable[[str], bool] = lambda text: True
+    # hand both implementations the raw input bytes instead of the parsed input, to cover their own readers
+    raw: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/{self.day:02d} {self.candidate}"
+
+
+PAIRS: dict[str, Pair] = {
+    pair.name: pair
+    for pair in (
+        Pair(2023, 1, "part1_rows", "part1_vectorized"),
+        Pair(2023, 3, "part1_sets", "part1_stream"),
+        Pair(2023, 3, "part2_sets", "part2_stream"),
+        Pair(2023, 3, "part1_stream", "part1_vectorized", raw=True),
+        Pair(2023, 3, "part2_stream", "part2_vectorized", raw=True),
+        Pair(2023, 4, "part2_recursive", "part2_dynamic"),
+        Pair(2023, 5, "part2_brute_force", "part2", scale=0.1, generator=_small_almanac, valid=_complete_almanac),
+    )
+}
+
+
+@dataclass
+class Counterexample:
+    seed: int
+    text: str
+    expected: Any
+    actual: Any
+
+    def __str__(self) -> str:
+        return f"seed {self.seed}: expected {self.expected!r}, got {self.actual!r} for input:\n{self.text}"
+
+
+@dataclass
+class FuzzReport:
+    pair: Pair
+    runs: int = 0
+    reference_seconds: float = 0.0
+    candidate_seconds: float = 0.0
+    failures: list[Counterexample] = field(default_factory=list)
+
+    @property
+    def speedup(self) -> float:
+        return self.reference_seconds / self.candidate_seconds if self.candidate_seconds else float("inf")
+
+    def __str__(self) -> str:
+        return (
+            f"{self.pair.name} vs {self.pair.reference}: {self.runs} inputs, {len(self.failures)} disagreements, "
+            f"{self.speedup:.1f}x faster ({format_seconds(self.candidate_seconds)} vs "
+            f"{format_seconds(self.reference_seconds)})"
+        )
+
+
+class _Solvers:
+    def __init__(self, pair: Pair):
+        module = load(find(pair.year, pair.day))
+        self.parse = getattr(module, PARSER)
+        self.reference = getattr(module, pair.reference)
+        self.candidate = getattr(module, pair.candidate)
+        self.valid = pair.valid
+        self.raw = pair.raw
+
+    def outcomes(self, text: str) -> tuple[Any, Any, float, float] | None:
+        try:
+            if not self.valid(text):
+                return None
+            data = text.encode() if self.raw else self.parse(text.encode())
+            expected, reference_seconds = time_call(self.reference, data)
+        except Exception:
+            return None
+        try:
+            actual, candidate_seconds = time_call(self.candidate, data)
+        except Exception as exc:
+            actual, candidate_seconds = exc, 0.0
+        return expected, actual, reference_seconds, candidate_seconds
+
+    def disagree(self, text: str) -> bool:
+        outcome = self.outcomes(text)
+        return outcome is not None and _differ(outcome[0], outcome[1])
+
+
+def _differ(expected: Any, actual: Any) -> bool:
+    return isinstance(actual, Exception) or expected != actual
+
+
+def _shrink_lines(lines: list[str], failing: Callable[[list[str]], bool], budget: list[int]) -> list[str]:
+    chunk = max(1, len(lines) // 2)
+    while chunk >= 1:
+        i = 0
+        while i < len(lines) and budget[0] > 0:
+            candidate = lines[:i] + lines[i + chunk :]
+            budget[0] -= 1
+            if candidate and failing(candidate):
+                lines = candidate
+            else:
+                i += chunk
+        chunk //= 2
+    return lines
+
+
+def _shrink_numbers(text: str, failing: Callable[[str], bool], budget: list[int]) -> str:
+    pos = 0
+    while (match := _INTEGER.search(text, pos)) and budget[0] > 0:
+        value = int(match[0])
+        for smaller in sorted({0, 1, value // 2, value - 1}):
+            if not 0 <= smaller < value:
+                continue
+            candidate = f"{text[: match.start()]}{smaller}{text[match.end() :]}"
+            budget[0] -= 1
+            if failing(candidate):
+                text, value = candidate, smaller
+                break
+        pos = match.start() + len(str(value))
+    return text
+
+
+def shrink(text: str, failing: Callable[[str], bool], max_steps: int = MAX_SHRINK_STEPS) -> str:
+    budget = [max_steps]
+    while budget[0] > 0:
+        lines = _shrink_lines(text.splitlines(), lambda ls: failing("\n".join(ls) + "\n"), budget)
+        smaller = _shrink_numbers("\n".join(lines) + "\n", failing, budget)
+        if smaller == text:
+            break
+        text = smaller
+    return text
+
+
+def fuzz(pair: Pair, runs: int = DEFAULT_RUNS, seed: int = 0, shrinking: bool = True) -> FuzzReport:
+    day = find(pair.year, pair.day)
+    solvers = _Solvers(pair)
+    report = FuzzReport(pair)
+    for i in range(seed, seed + runs):
+        text = pair.generator(random.Random(i), pair.scale) if pair.generator else generate(day, pair.scale, i)
+        outcome = solvers.outcomes(text)
+        if outcome is None:
+            continue
+        expected, actual, reference_seconds, candidate_seconds = outcome
+        report.runs += 1
+        report.reference_seconds += reference_seconds
+        report.candidate_seconds += candidate_seconds
+        if _differ(expected, actual):
+            if shrinking:
+                text = shrink(text, solvers.disagree)
+                expected, actual, *_ = solvers.outcomes(text) or (expected, actual)
+            report.failures.append(Counterexample(i, text, expected, actual))
+    return report
+
+
+def fuzz_all(
+    names: list[str] | None = None, runs: int = DEFAULT_RUNS, seed: int = 0, shrinking: bool = True
+) -> Iterator[FuzzReport]:
+    unknown = [name for name in names or [] if name not in PAIRS]
+    if unknown:
+        raise LookupError(f"Unknown pairs: {', '.join(unknown)}, known: {', '.join(PAIRS)}.")
+    for name in names or PAIRS:
+        yield fuzz(PAIRS[name], runs, seed, shrinking)
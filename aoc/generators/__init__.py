@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import importlib
+import random
+from typing import Callable, TypeAlias, TypeVar
+
+from aoc.days import Day
+
+Generator: TypeAlias = Callable[[random.Random, float], str]
+G = TypeVar("G", bound=Generator)
+
+GENERATORS: dict[tuple[int, int], Generator] = {}
+_MODULES: tuple[str, ...] = ("aoc.generators.y2023", "aoc.generators.y2024")
+
+
+def register(year: int, day: int) -> Callable[[G], G]:
+    def decorator(func: G) -> G:
+        GENERATORS[year, day] = func
+        return func
+
+    return decorator
+
+
+def _registry() -> dict[tuple[int, int], Generator]:
+    for name in _MODULES:
+        importlib.import_module(name)
+    return GENERATORS
+
+
+def has_generator(day: Day) -> bool:
+    return (day.year, day.day) in _registry()
+
+
+def generate(day: Day, scale: float = 1.0, seed: int = 0) -> str:
+    if scale <= 0:
+        raise ValueError("scale must be positive")
+    func = _registry().get((day.year, day.day))
+    if func is None:
+        raise LookupError(f"No input generator for {day.label}.")
+    return func(random.Random(seed), scale)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import math
+import random
+import string
+from itertools import product
+
+Cell = tuple[int, int]
+
+
+def scaled(base: int, scale: float, minimum: int = 1) -> int:
+    return max(minimum, round(base * scale))
+
+
+def side(base: int, scale: float, minimum: int = 3) -> int:
+    return max(minimum, round(base * math.sqrt(scale)))
+
+
+def names(rng: random.Random, count: int, alphabet: str = string.ascii_lowercase, length: int = 2) -> list[str]:
+    pool: list[str] = []
+    while len(pool) < count:
+        pool += ["".join(p) for p in product(alphabet, repeat=length)]
+        length += 1
+    return rng.sample(pool, count)
+
+
+def maze(rng: random.Random, height: int, width: int, rooms: float = 0.0) -> set[Cell]:
+    cells: set[Cell] = {(0, 0)}
+    frontier: list[tuple[Cell, Cell]] = [((0, 0), (0, 2)), ((0, 0), (2, 0))]
+    while frontier:
+        i = rng.randrange(len(frontier))
+        frontier[i], frontier[-1] = frontier[-1], frontier[i]
+        (r, c), (nr, nc) = frontier.pop()
+        if not (0 <= nr < height and 0 <= nc < width) or (nr, nc) in cells:
+            continue
+        cells |= {((r + nr) // 2, (c + nc) // 2), (nr, nc)}
+        frontier += [((nr, nc), (nr + dr, nc + dc)) for dr, dc in ((-2, 0), (0, 2), (2, 0), (0, -2))]
+    for r in range(1, height - 1, 2):
+        for c in range(1, width - 1, 2):
+            walls = sum(cell not in cells for cell in ((r - 1, c), (r, c + 1), (r + 1, c), (r, c - 1)))
+            if walls == 1 and rng.random() < rooms:
+                cells.add((r, c))
+    while _fill_holes(cells, height, width) | _fix_pinches(cells):
+        pass
+    return cells
+
+
+def _fill_holes(cells: set[Cell], height: int, width: int) -> bool:
+    outside: set[Cell] = {(-1, -1)}
+    stack: list[Cell] = [(-1, -1)]
+    while stack:
+        r, c = stack.pop()
+        for nr, nc in ((r - 1, c), (r, c + 1), (r + 1, c), (r, c - 1)):
+            if -1 <= nr <= height and -1 <= nc <= width and (nr, nc) not in cells and (nr, nc) not in outside:
+                outside.add((nr, nc))
+                stack.append((nr, nc))
+    holes = {(r, c) for r in range(height) for c in range(width)} - cells - outside
+    cells |= holes
+    return bool(holes)
+
+
+def _fix_pinches(cells: set[Cell]) -> bool:
+    fixed = False
+    for r, c in list(cells):
+        for dc in (-1, 1):
+            if (r + 1, c + dc) in cells and (r, c + dc) not in cells and (r + 1, c) not in cells:
+                cells.add((r + 1, c))
+                fixed = True
+    return fixed
+
+
+def boundary(cells: set[Cell]) -> list[Cell]:
+    edges: dict[Cell, Cell] = {}
+    for r, c in cells:
+        if (r - 1, c) not in cells:
+            edges[r, c] = r, c + 1
+        if (r, c + 1) not in cells:
+            edges[r, c + 1] = r + 1, c + 1
+        if (r + 1, c) not in cells:
+            edges[r + 1, c + 1] = r + 1, c
+        if (r, c - 1) not in cells:
+            edges[r + 1, c] = r, c
+    start = min(edges)
+    loop: list[Cell] = [start]
+    point = edges[start]
+    while point != start:
+        loop.append(point)
+        point = edges[point]
+    return loop
@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import random
+import string
+
+from aoc.generators import register
+from aoc.generators.shapes import boundary, maze, names, scaled, side
+
+SPELLED: tuple[str, ...] = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+COLORS: tuple[str, ...] = ("red", "green", "blue")
+SYMBOLS: str = "*#+$/@%=&-"
+CARDS: str = "23456789TJQKA"
+ALMANAC: tuple[str, ...] = ("seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location")
+PIPES: dict[frozenset[str], str] = {
+    frozenset("NS"): "|",
+    frozenset("EW"): "-",
+    frozenset("NE"): "L",
+    frozenset("NW"): "J",
+    frozenset("SW"): "7",
+    frozenset("SE"): "F",
+}
+HEADINGS: dict[tuple[int, int], str] = {(-1, 0): "N", (1, 0): "S", (0, 1): "E", (0, -1): "W"}
+DIG_DIRS: dict[tuple[int, int], tuple[str, int]] = {
+    (0, 1): ("R", 0),
+    (1, 0): ("D", 1),
+    (0, -1): ("L", 2),
+    (-1, 0): ("U", 3),
+}
+
+
+def _lines(rows: list[str]) -> str:
+    return "\n".join(rows) + "\n"
+
+
+def _grid(rng: random.Random, height: int, width: int, weights: dict[str, float]) -> list[list[str]]:
+    chars, probs = list(weights), list(weights.values())
+    return [rng.choices(chars, probs, k=width) for _ in range(height)]
+
+
+@register(2023, 1)
+def calibration(rng: random.Random, scale: float) -> str:
+    rows: list[str] = []
+    for _ in range(scaled(1000, scale)):
+        tokens = [rng.choice(string.digits)]
+        for _ in range(rng.randint(1, 8)):
+            roll = rng.random()
+            if roll < 0.3:
+                tokens.append(rng.choice(string.digits))
+            elif roll < 0.6:
+                tokens.append(rng.choice(SPELLED))
+            else:
+                tokens.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        rng.shuffle(tokens)
+        rows.append("".join(tokens))
+    return _lines(rows)
+
+
+@register(2023, 2)
+def cube_games(rng: random.Random, scale: float) -> str:
+    rows: list[str] = []
+    for game_id in range(1, scaled(100, scale) + 1):
+        rounds = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(COLORS, rng.randint(1, 3))
+            rounds.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        rows.append(f"Game {game_id}: {'; '.join(rounds)}")
+    return _lines(rows)
+
+
+@register(2023, 3)
+def engine_schematic(rng: random.Random, scale: float) -> str:
+    n = side(140, scale)
+    rows: list[str] = []
+    for _ in range(n):
+        row: list[str] = []
+        while len(row) < n:
+            roll = rng.random()
+            digits = rng.randint(1, 3)
+            if roll < 0.12 and len(row) + digits < n:
+                row += str(rng.randint(10 ** (digits - 1), 10**digits - 1)) + "."
+            elif roll < 0.16:
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+        rows.append("".join(row[:n]))
+    # some inputs end in a blank line, which the grid-based engines must not count as a row
+    if rng.random() < 0.25:
+        rows.append("")
+    return _lines(rows)
+
+
+@register(2023, 4)
+def scratchcards(rng: random.Random, scale: float) -> str:
+    n = scaled(200, scale)
+    width = len(str(n))
+    rows: list[str] = []
+    for card_id in range(1, n + 1):
+        numbers = rng.sample(range(1, 100), 35)
+        winning, others = numbers[:10], numbers[10:]
+        matches = min(rng.choice((0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10)), n - card_id)
+        chosen = winning[:matches] + others[: 25 - matches]
+        rng.shuffle(chosen)
+        rows.append(
+            f"Card {card_id:>{width}}: {' '.join(f'{x:2}' for x in winning)} | {' '.join(f'{x:2}' for x in chosen)}"
+        )
+    return _lines(rows)
+
+
+@register(2023, 5)
+def almanac(rng: random.Random, scale: float, limit: int = 2**32) -> str:
+    seeds: list[int] = []
+    for _ in range(scaled(10, scale)):
+        start = rng.randrange(limit // 2)
+        seeds += [start, rng.randrange(1, limit // 20)]
+    rows = [f"seeds: {' '.join(map(str, seeds))}"]
+    for src, dest in zip(ALMANAC, ALMANAC[1:]):
+        rows += ["", f"{src}-to-{dest} map:"]
+        cuts = sorted(rng.sample(range(1, limit), 2 * scaled(30, scale)))
+        spans = list(zip(cuts[::2], cuts[1::2]))
+        gaps = sorted(rng.sample(range(limit - sum(stop - start for start, stop in spans)), len(spans)))
+        used = 0
+        for gap, (start, stop) in zip(gaps, rng.sample(spans, len(spans))):
+            rows.append(f"{used + gap} {start} {stop - start}")
+            used += stop - start
+    return _lines(rows)
+
+
+@register(2023, 6)
+def boat_races(rng: random.Random, scale: float) -> str:
+    # part 2 concatenates every race into one solved with floats, so the race count stays bounded
+    times = [rng.randint(40, 99) for _ in range(min(30, scaled(4, scale)))]
+    dists = [rng.randint(t * t // 8, t * t // 4 - 1) for t in times]
+    return _lines([f"Time: {' '.join(map(str, times))}", f"Distance: {' '.join(map(str, dists))}"])
+
+
+@register(2023, 7)
+def camel_cards(rng: random.Random, scale: float) -> str:
+    n = min(scaled(1000, scale), len(CARDS) ** 5)
+    hands: set[str] = set()
+    while len(hands) < n:
+        hands.add("".join(rng.choices(CARDS, k=5)))
+    rows = [f"{hand} {rng.randint(1, 1000)}" for hand in hands]
+    rng.shuffle(rows)
+    return _lines(rows)
+
+
+@register(2023, 8)
+def haunted_network(rng: random.Random, scale: float) -> str:
+    ghosts = scaled(6, scale)
+    lengths = [rng.randint(80, 160) for _ in range(ghosts)]
+    pool = iter(names(rng, sum(lengths), string.ascii_uppercase[1:-1], length=3))
+    starts = ["AAA"] + [f"{name}A" for name in names(rng, ghosts - 1, string.ascii_uppercase[1:-1])]
+    ends = ["ZZZ"] + [f"{name}Z" for name in names(rng, ghosts - 1, string.ascii_uppercase[1:-1])]
+    nodes: list[str] = []
+    for start, end, length in zip(starts, ends, lengths):
+        chain = [start] + [next(pool) for _ in range(length - 1)] + [end]
+        for node, target in zip(chain, chain[1:]):
+            nodes.append(f"{node} = ({target}, {target})")
+        nodes.append(f"{end} = ({chain[1]}, {chain[1]})")
+    rng.shuffle(nodes)
+    instructions = "".join(rng.choices("LR", k=rng.randint(50, 300)))
+    return _lines([instructions, ""] + nodes)
+
+
+@register(2023, 9)
+def oasis_report(rng: random.Random, scale: float) -> str:
+    rows: list[str] = []
+    for _ in range(scaled(200, scale)):
+        coeffs = [rng.randint(-5, 5) for _ in range(rng.randint(1, 7))]
+        rows.append(" ".join(str(sum(a * x**i for i, a in enumerate(coeffs))) for x in range(-5, 16)))
+    return _lines(rows)
+
+
+@register(2023, 10)
+def pipe_maze(rng: random.Random, scale: float) -> str:
+    n = side(140, scale, minimum=5)
+    loop = boundary(maze(rng, n - 3, n - 3, rooms=0.1))
+    grid = _grid(rng, n, n, {".": 0.4, "|": 0.1, "-": 0.1, "L": 0.1, "J": 0.1, "7": 0.1, "F": 0.1})
+    for i, (r, c) in enumerate(loop):
+        (pr, pc), (nr, nc) = loop[i - 1], loop[(i + 1) % len(loop)]
+        grid[r + 1][c + 1] = PIPES[frozenset((HEADINGS[pr - r, pc - c], HEADINGS[nr - r, nc - c]))]
+    r, c = rng.choice(loop)
+    grid[r + 1][c + 1] = "S"
+    on_loop = set(loop)
+    for dr, dc in HEADINGS:
+        if (r + dr, c + dc) not in on_loop:
+            grid[r + dr + 1][c + dc + 1] = "."
+    return _lines(["".join(row) for row in grid])
+
+
+@register(2023, 11)
+def galaxy_image(rng: random.Random, scale: float) -> str:
+    n = side(140, scale)
+    empty_rows = set(rng.sample(range(n), n // 20))
+    empty_cols = set(rng.sample(range(n), n // 20))
+    rows: list[str] = []
+    for r in range(n):
+        row = ["#" if rng.random() < 0.02 and r not in empty_rows and c not in empty_cols else "." for c in range(n)]
+        rows.append("".join(row))
+    return _lines(rows)
+
+
+def _mirror_pattern(rng: random.Random) -> list[str]:
+    height, width = rng.randint(7, 17), rng.randint(5, 17)
+    rows = [rng.choices("#.", k=width) for _ in range(height)]
+    col_line = rng.randint(1, width - 1)
+    for row in rows:
+        for j in range(min(col_line, width - col_line)):
+            row[col_line + j] = row[col_line - 1 - j]
+    row_line = rng.randint(1, (height - 1) // 2)
+    for j in range(row_line):
+        rows[row_line + j] = rows[row_line - 1 - j][:]
+    c = rng.choice([col_line - 1 - j for j in range(min(col_line, width - col_line))])
+    r = rng.randrange(2 * row_line, height)
+    rows[r][c] = "#" if rows[r][c] == "." else "."
+    if rng.random() < 0.5:
+        rows = [list(col) for col in zip(*rows)]
+    return ["".join(row) for row in rows]
+
+
+@register(2023, 13)
+def mirror_valley(rng: random.Random, scale: float) -> str:
+    rows: list[str] = []
+    for i in range(scaled(100, scale)):
+        rows += ([""] if i else []) + _mirror_pattern(rng)
+    return _lines(rows)
+
+
+@register(2023, 14)
+def reflector_dish(rng: random.Random, scale: float) -> str:
+    n = side(100, scale)
+    return _lines(["".join(row) for row in _grid(rng, n, n, {".": 0.65, "O": 0.2, "#": 0.15})])
+
+
+@register(2023, 15)
+def init_sequence(rng: random.Random, scale: float) -> str:
+    labels = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6))) for _ in range(scaled(500, scale))]
+    steps: list[str] = []
+    for _ in range(scaled(4000, scale)):
+        label = rng.choice(labels)
+        steps.append(f"{label}={rng.randint(1, 9)}" if rng.random() < 0.6 else f"{label}-")
+    return ",".join(steps) + "\n"
+
+
+@register(2023, 16)
+def contraption(rng: random.Random, scale: float) -> str:
+    n = side(110, scale)
+    weights = {".": 0.9, "-": 0.025, "|": 0.025, "/": 0.025, "\\": 0.025}
+    return _lines(["".join(row) for row in _grid(rng, n, n, weights)])
+
+
+def _stretch(rng: random.Random, count: int, max_gap: int) -> list[int]:
+    coords = [0]
+    for _ in range(count):
+        coords.append(coords[-1] + rng.randint(1, max_gap))
+    return coords
+
+
+@register(2023, 18)
+def dig_plan(rng: random.Random, scale: float) -> str:
+    n = side(39, scale)
+    loop = boundary(maze(rng, n, n, rooms=0.5))
+    turns = zip(loop[-1:] + loop[:-1], loop, loop[1:] + loop[:1])
+    corners = [p for prev, p, nxt in turns if prev[0] != nxt[0] and prev[1] != nxt[1]]
+    short_rows, short_cols = _stretch(rng, n + 1, 12), _stretch(rng, n + 1, 12)
+    long_rows, long_cols = _stretch(rng, n + 1, 0xFFFFF // (n + 1)), _stretch(rng, n + 1, 0xFFFFF // (n + 1))
+    rows: list[str] = []
+    for (r, c), (nr, nc) in zip(corners, corners[1:] + corners[:1]):
+        heading = (nr > r) - (nr < r), (nc > c) - (nc < c)
+        name, code = DIG_DIRS[heading]
+        short = abs(short_rows[nr] - short_rows[r]) + abs(short_cols[nc] - short_cols[c])
+        long = abs(long_rows[nr] - long_rows[r]) + abs(long_cols[nc] - long_cols[c])
+        rows.append(f"{name} {short} (#{long:05x}{code})")
+    return _lines(rows)
+
+
+@register(2023, 19)
+def aplenty(rng: random.Random, scale: float) -> str:
+    n = scaled(550, scale)
+    pool = iter([name for name in names(rng, n) if name != "in"][: n - 1])
+    workflows: list[str] = []
+    queue: list[str] = ["in"]
+    created = 1
+    while queue:
+        name = queue.pop()
+        targets: list[str] = []
+        for _ in range(rng.randint(2, 4)):
+            if created < n and rng.random() < 0.6:
+                targets.append(next(pool))
+                queue.append(targets[-1])
+                created += 1
+            else:
+                targets.append(rng.choice("AR"))
+        rules = [f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{t}" for t in targets[:-1]]
+        workflows.append(f"{name}{{{','.join(rules + targets[-1:])}}}")
+    rng.shuffle(workflows)
+    parts = [
+        "{" + ",".join(f"{attr}={rng.randint(1, 4000)}" for attr in "xmas") + "}" for _ in range(scaled(200, scale))
+    ]
+    return _lines(workflows + [""] + parts)
+
+
+@register(2023, 20)
+def pulse_modules(rng: random.Random, scale: float) -> str:
+    counters, bits = scaled(4, scale), 12
+    pool = iter(names(rng, counters * (bits + 2) + 1))
+    final = next(pool)
+    broadcast: list[str] = []
+    modules: list[str] = [f"&{final} -> rx"]
+    for _ in range(counters):
+        cycle = rng.randrange(2 ** (bits - 1) + 1, 2**bits, 2)
+        flops = [next(pool) for _ in range(bits)]
+        hub, inverter = next(pool), next(pool)
+        broadcast.append(flops[0])
+        hub_targets = [inverter, flops[0]]
+        for j, flop in enumerate(flops):
+            targets = flops[j + 1 : j + 2]
+            if cycle >> j & 1:
+                targets.append(hub)
+            elif j:
+                hub_targets.append(flop)
+            rng.shuffle(targets)
+            modules.append(f"%{flop} -> {', '.join(targets)}")
+        rng.shuffle(hub_targets)
+        modules += [f"&{hub} -> {', '.join(hub_targets)}", f"&{inverter} -> {final}"]
+    modules.append(f"broadcaster -> {', '.join(broadcast)}")
+    rng.shuffle(modules)
+    return _lines(modules)
+
+
+@register(2023, 21)
+def step_garden(rng: random.Random, scale: float) -> str:
+    n = side(131, scale) | 1
+    grid = _grid(rng, n, n, {".": 0.88, "#": 0.12})
+    mid = n // 2
+    for i in range(n):
+        grid[mid][i] = grid[i][mid] = grid[0][i] = grid[i][0] = grid[-1][i] = grid[i][-1] = "."
+    grid[mid][mid] = "S"
+    return _lines(["".join(row) for row in grid])
+
+
+@register(2023, 22)
+def sand_bricks(rng: random.Random, scale: float) -> str:
+    n = scaled(1400, scale)
+    width = side(10, scale, minimum=3)
+    heights: dict[tuple[int, int], int] = {}
+    rows: list[str] = []
+    for _ in range(n):
+        axis, length = rng.randrange(3), rng.randint(0, 4)
+        x, y = rng.randrange(width), rng.randrange(width)
+        end = [x, y, 0]
+        if axis < 2:
+            end[axis] = min(width - 1, end[axis] + length)
+        footprint = [(i, j) for i in range(x, end[0] + 1) for j in range(y, end[1] + 1)]
+        z = max(heights.get(cell, 0) for cell in footprint) + 1 + rng.randint(0, 3)
+        end[2] = z + (length if axis == 2 else 0)
+        for cell in footprint:
+            heights[cell] = end[2]
+        rows.append(f"{x},{y},{z}~{end[0]},{end[1]},{end[2]}")
+    rng.shuffle(rows)
+    return _lines(rows)
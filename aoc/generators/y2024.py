@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import random
+import string
+
+from aoc.generators import register
+from aoc.generators.shapes import scaled, side
+
+JUNK: str = string.ascii_letters + string.digits + "()[]{}<>,;:'!@#$%^&*-+=?/ "
+
+
+def _lines(rows: list[str]) -> str:
+    return "\n".join(rows) + "\n"
+
+
+@register(2024, 1)
+def location_lists(rng: random.Random, scale: float) -> str:
+    n = scaled(1000, scale)
+    left = [rng.randrange(10000, 100000) for _ in range(n)]
+    right = [rng.choice(left) if rng.random() < 0.3 else rng.randrange(10000, 100000) for _ in range(n)]
+    return _lines([f"{a}   {b}" for a, b in zip(left, right)])
+
+
+@register(2024, 2)
+def reactor_reports(rng: random.Random, scale: float) -> str:
+    rows: list[str] = []
+    for _ in range(scaled(1000, scale)):
+        sign = rng.choice((-1, 1))
+        levels = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + sign * rng.randint(1, 3))
+        if rng.random() < 0.5:
+            levels[rng.randrange(len(levels))] += rng.choice((-4, -1, 0, 1, 4))
+        rows.append(" ".join(map(str, levels)))
+    return _lines(rows)
+
+
+def _instruction(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.5:
+        return f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+    if roll < 0.6:
+        return "do()"
+    if roll < 0.7:
+        return "don't()"
+    return rng.choice(("mul(4*", "mul ( 2 , 4 )", "mul[3,7]", "do_not_mul(5,5)", f"mul({rng.randint(1, 999)},"))
+
+
+@register(2024, 3)
+def corrupted_memory(rng: random.Random, scale: float) -> str:
+    rows: list[str] = []
+    for _ in range(scaled(6, scale)):
+        chunks: list[str] = []
+        while sum(map(len, chunks)) < 3000:
+            chunks.append(_instruction(rng) if rng.random() < 0.3 else "".join(rng.choices(JUNK, k=rng.randint(1, 12))))
+        rows.append("".join(chunks))
+    return _lines(rows)
+
+
+@register(2024, 4)
+def word_search(rng: random.Random, scale: float) -> str:
+    n = side(140, scale)
+    return _lines(["".join(rng.choices("XMAS", k=n)) for _ in range(n)])
+
+
+@register(2024, 5)
+def print_queue(rng: random.Random, scale: float) -> str:
+    order = rng.sample(range(10, 100), 49)
+    rules = [f"{a}|{b}" for i, a in enumerate(order) for b in order[i + 1 :]]
+    rng.shuffle(rules)
+    updates: list[str] = []
+    for _ in range(scaled(200, scale)):
+        pages = sorted(rng.sample(range(len(order)), rng.randrange(5, 24, 2)))
+        update = [order[i] for i in pages]
+        if rng.random() < 0.5:
+            rng.shuffle(update)
+        updates.append(",".join(map(str, update)))
+    return _lines(rules + [""] + updates)
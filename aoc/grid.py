@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+
+class Grid:
+    __slots__ = ("cells", "height", "width", "offset", "row_step", "col_step")
+
+    def __init__(
+        self,
+        cells: bytearray,
+        height: int,
+        width: int,
+        offset: int = 0,
+        row_step: int | None = None,
+        col_step: int = 1,
+    ):
+        self.cells = cells
+        self.height = height
+        self.width = width
+        self.offset = offset
+        self.row_step = width if row_step is None else row_step
+        self.col_step = col_step
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str | bytes | memoryview]) -> Grid:
+        rows = [line.encode() if isinstance(line, str) else bytes(line) for line in lines]
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("All rows of a grid must have the same length.")
+        return cls(bytearray(b"".join(rows)), len(rows), width)
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.height, self.width
+
+    @property
+    def contiguous(self) -> bool:
+        return self.offset == 0 and self.col_step == 1 and self.row_step == self.width
+
+    @property
+    def deltas(self) -> tuple[int, int, int, int]:
+        return -self.row_step, self.col_step, self.row_step, -self.col_step
+
+    def index(self, r: int, c: int) -> int:
+        return self.offset + r * self.row_step + c * self.col_step
+
+    def coord(self, i: int) -> tuple[int, int]:
+        if not self.contiguous:
+            raise ValueError("Flat indices can only be converted back on a contiguous grid, use copy() first.")
+        return divmod(i, self.width)
+
+    def in_bounds(self, r: int, c: int) -> bool:
+        return 0 <= r < self.height and 0 <= c < self.width
+
+    def __getitem__(self, loc: tuple[int, int]) -> int:
+        r, c = loc
+        if not (0 <= r < self.height and 0 <= c < self.width):
+            raise IndexError(loc)
+        return self.cells[self.offset + r * self.row_step + c * self.col_step]
+
+    def __setitem__(self, loc: tuple[int, int], value: int) -> None:
+        r, c = loc
+        if not (0 <= r < self.height and 0 <= c < self.width):
+            raise IndexError(loc)
+        self.cells[self.offset + r * self.row_step + c * self.col_step] = value
+
+    def get(self, loc: tuple[int, int], default: int = -1) -> int:
+        r, c = loc
+        if not (0 <= r < self.height and 0 <= c < self.width):
+            return default
+        return self.cells[self.offset + r * self.row_step + c * self.col_step]
+
+    def char(self, r: int, c: int) -> str:
+        return chr(self[r, c])
+
+    def _line(self, start: int, step: int, n: int) -> bytes:
+        if n <= 1:
+            return bytes(self.cells[start : start + n])
+        stop = start + n * step
+        return bytes(self.cells[start : stop if stop >= 0 else None : step])
+
+    def row(self, r: int) -> bytes:
+        return self._line(self.index(r, 0), self.col_step, self.width)
+
+    def set_row(self, r: int, values: bytes) -> None:
+        if len(values) != self.width:
+            raise ValueError(f"Expected {self.width} values, got {len(values)}.")
+        start = self.index(r, 0)
+        stop = start + self.width * self.col_step
+        self.cells[start : stop if stop >= 0 else None : self.col_step] = values
+
+    def col(self, c: int) -> bytes:
+        return self._line(self.index(0, c), self.row_step, self.height)
+
+    def rows(self) -> list[bytes]:
+        return [self.row(r) for r in range(self.height)]
+
+    def lines(self) -> list[str]:
+        return [row.decode() for row in self.rows()]
+
+    def diagonals(self, anti: bool = False) -> list[bytes]:
+        step = self.row_step - self.col_step if anti else self.row_step + self.col_step
+        starts = [(0, c) for c in range(self.width)]
+        starts += [(r, self.width - 1 if anti else 0) for r in range(1, self.height)]
+        res: list[bytes] = []
+        for r, c in starts:
+            n = min(self.height - r, c + 1 if anti else self.width - c)
+            res.append(self._line(self.index(r, c), step, n))
+        return res
+
+    def transpose(self) -> Grid:
+        return Grid(self.cells, self.width, self.height, self.offset, self.col_step, self.row_step)
+
+    def rotate_cw(self) -> Grid:
+        offset = self.index(self.height - 1, 0)
+        return Grid(self.cells, self.width, self.height, offset, self.col_step, -self.row_step)
+
+    def rotate_ccw(self) -> Grid:
+        offset = self.index(0, self.width - 1)
+        return Grid(self.cells, self.width, self.height, offset, -self.col_step, self.row_step)
+
+    def copy(self) -> Grid:
+        return Grid(bytearray(b"".join(self.rows())), self.height, self.width)
+
+    def padded(self, fill: int) -> Grid:
+        border = bytes([fill])
+        rows = [border * (self.width + 2)]
+        rows += [border + row + border for row in self.rows()]
+        rows.append(rows[0])
+        return Grid(bytearray(b"".join(rows)), self.height + 2, self.width + 2)
+
+    def find(self, value: int) -> tuple[int, int] | None:
+        return next(self.positions(value), None)
+
+    def positions(self, value: int) -> Iterator[tuple[int, int]]:
+        for r in range(self.height):
+            row = self.row(r)
+            c = row.find(value)
+            while c != -1:
+                yield r, c
+                c = row.find(value, c + 1)
+
+    def neighbors(self, r: int, c: int) -> Iterator[tuple[int, int]]:
+        for nr, nc in ((r - 1, c), (r, c + 1), (r + 1, c), (r, c - 1)):
+            if 0 <= nr < self.height and 0 <= nc < self.width:
+                yield nr, nc
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.size == other.size and self.rows() == other.rows()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __bytes__(self) -> bytes:
+        return b"".join(self.rows())
+
+    def __str__(self) -> str:
+        return "\n".join(self.lines())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} {self.height}x{self.width}"
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import math
+import platform
+import statistics
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from aoc.bench import BenchStats, format_seconds
+from aoc.days import ROOT
+
+DEFAULT_HISTORY: Path = ROOT / "bench_output.txt"
+DEFAULT_ALPHA: float = 0.01
+# medians closer than this are never reported, however significant the difference
+DEFAULT_THRESHOLD: float = 0.05
+
+
+def current_commit() -> str:
+    try:
+        sha = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{sha}+dirty" if dirty else sha
+
+
+def record(stats: Iterable[BenchStats], path: str | Path = DEFAULT_HISTORY, commit: str | None = None) -> str:
+    commit = commit or current_commit()
+    meta = {
+        "commit": commit,
+        "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.node(),
+    }
+    with open(path, "a") as file:
+        for s in stats:
+            file.write(json.dumps({**meta, "name": s.name, "samples": s.samples}) + "\n")
+    return commit
+
+
+def read_history(path: str | Path = DEFAULT_HISTORY) -> list[dict[str, Any]]:
+    with open(path) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def commits(entries: Iterable[dict[str, Any]]) -> list[str]:
+    return list(dict.fromkeys(e["commit"] for e in entries))
+
+
+def samples_for(entries: Iterable[dict[str, Any]], commit: str) -> dict[str, list[float]]:
+    found: dict[str, list[float]] = {}
+    for entry in entries:
+        if entry["commit"] == commit:
+            found.setdefault(entry["name"], []).extend(entry["samples"])
+    return found
+
+
+def mann_whitney(slower: list[float], faster: list[float]) -> float:
+    n1, n2 = len(slower), len(faster)
+    ranked = sorted([(t, 0) for t in slower] + [(t, 1) for t in faster])
+    ranks = [0.0] * len(ranked)
+    ties = 0.0
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        ranks[i : j + 1] = [(i + j) / 2 + 1] * (j - i + 1)
+        ties += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+    u = sum(r for r, (_, group) in zip(ranks, ranked) if group == 0) - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * (n + 1 - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+@dataclass
+class Change:
+    name: str
+    baseline: float
+    candidate: float
+    p_value: float
+    significant: bool
+
+    @property
+    def ratio(self) -> float:
+        return self.candidate / self.baseline if self.baseline else math.inf
+
+    def __str__(self) -> str:
+        flag = " <-- slower" if self.significant else ""
+        return (
+            f"{self.name}: {format_seconds(self.baseline)} -> {format_seconds(self.candidate)} "
+            f"({self.ratio - 1:+.1%}, p={self.p_value:.3g}){flag}"
+        )
+
+
+def compare(
+    baseline: dict[str, list[float]],
+    candidate: dict[str, list[float]],
+    alpha: float = DEFAULT_ALPHA,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Iterator[Change]:
+    for name in sorted(baseline.keys() & candidate.keys()):
+        old, new = baseline[name], candidate[name]
+        old_median, new_median = statistics.median(old), statistics.median(new)
+        p_value = mann_whitney(new, old)
+        significant = p_value < alpha and new_median > old_median * (1 + threshold)
+        yield Change(name, old_median, new_median, p_value, significant)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from aoc.days import Day, load
+from aoc.reader import MappedInput, Source
+
+DEFAULT_CHUNK_BYTES: int = 8 * 1024 * 1024
+LINE_JOBS: str = "LINE_JOBS"
+
+
+@dataclass(frozen=True)
+class LineJob:
+    mapper: Callable[[str], Any]
+    combine: Callable[[Iterable[Any]], Any] = sum
+    finish: Callable[[list[Any]], Any] = sum
+
+
+def line_jobs(day: Day) -> dict[str, LineJob]:
+    return getattr(load(day), LINE_JOBS, {})
+
+
+def line_job(day: Day, part: str) -> LineJob:
+    jobs = line_jobs(day)
+    if part not in jobs:
+        raise LookupError(f"{day.label} {part} is not declared line-independent in {LINE_JOBS}.")
+    return jobs[part]
+
+
+def _map_text(job: LineJob, text: str) -> Any:
+    return job.combine(job.mapper(line) for line in text.splitlines() if line.strip())
+
+
+def _map_chunk(day: Day, part: str, path: str | os.PathLike, start: int, stop: int) -> Any:
+    with MappedInput(path) as mapped:
+        text = str(mapped.data[start:stop], "utf-8")
+    return _map_text(line_job(day, part), text)
+
+
+def map_lines(
+    day: Day, part: str, source: Source, workers: int | None = None, chunk_bytes: int = DEFAULT_CHUNK_BYTES
+) -> Any:
+    job = line_job(day, part)
+    if not isinstance(source, (str, os.PathLike)):
+        with MappedInput(source) as mapped:
+            return job.finish([_map_text(job, str(mapped.data, "utf-8"))])
+    with MappedInput(source) as mapped:
+        bounds = mapped.chunks(chunk_bytes)
+    if workers == 1 or len(bounds) < 2:
+        return job.finish([_map_chunk(day, part, source, start, stop) for start, stop in bounds])
+    # imported here so that day modules declaring LINE_JOBS do not pay for multiprocessing at load time
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_map_chunk, day, part, source, start, stop) for start, stop in bounds]
+        return job.finish([future.result() for future in futures])
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import gc
+import inspect
+import json
+import multiprocessing
+import re
+import resource
+import sys
+import threading
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, Iterator
+
+from aoc.days import PARSER, PARTS, Day, load, load_revision
+from aoc.profiling import DEFAULT_SAMPLE_INTERVAL, format_bytes
+
+METRICS: tuple[str, ...] = ("peak_rss", "traced_peak", "peak_blocks")
+DEFAULT_TOLERANCE: float = 0.1
+# growth below these is noise from the allocator and the interpreter, never a regression
+NOISE_FLOOR: dict[str, int] = {"peak_rss": 4 * 1024**2, "traced_peak": 256 * 1024, "peak_blocks": 5000}
+_STATUS = Path("/proc/self/status")
+_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+
+@dataclass
+class MemoryStats:
+    name: str
+    peak_rss: int
+    traced_peak: int
+    peak_blocks: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name} | peak RSS {format_bytes(self.peak_rss)} | traced peak {format_bytes(self.traced_peak)} | "
+            f"peak blocks {self.peak_blocks}"
+        )
+
+
+def _reset_peak_rss() -> None:
+    try:
+        _CLEAR_REFS.write_text("5")
+    except OSError:
+        pass
+
+
+def _peak_rss() -> int:
+    try:
+        match = re.search(r"VmHWM:\s+(\d+) kB", _STATUS.read_text())
+    except OSError:
+        match = None
+    if match:
+        return int(match[1]) * 1024
+    # ru_maxrss is a process-wide high-water mark: kilobytes on Linux, bytes on macOS
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+class _BlockPoller:
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> _BlockPoller:
+        self.peak = sys.getallocatedblocks()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, sys.getallocatedblocks())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, sys.getallocatedblocks())
+
+
+def measure(func: Callable, *args, name: str = "", **kwargs) -> tuple[Any, MemoryStats]:
+    gc.collect()
+    _reset_peak_rss()
+    baseline = sys.getallocatedblocks()
+    with _BlockPoller() as blocks:
+        res = func(*args, **kwargs)
+    peak_rss = _peak_rss()
+    del res
+    gc.collect()
+    tracemalloc.start()
+    try:
+        res = func(*args, **kwargs)
+        traced_peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return res, MemoryStats(name or func.__name__, peak_rss, traced_peak, blocks.peak - baseline)
+
+
+def _measure_module(day: Day, module: ModuleType, suffix: str = "") -> Iterator[MemoryStats]:
+    data, stats = measure(getattr(module, PARSER), day.input_path, name=f"{day.label} {PARSER}{suffix}")
+    yield stats
+    for part in PARTS:
+        yield measure(getattr(module, part), data, name=f"{day.label} {part}{suffix}")[1]
+
+
+def _measure_day(day: Day) -> list[MemoryStats]:
+    return list(_measure_module(day, load(day)))
+
+
+def _takes_source(func: Any) -> bool:
+    try:
+        params = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD, p.VAR_POSITIONAL) for p in params)
+
+
+def _measure_revision(day: Day, revision: str) -> list[MemoryStats]:
+    module = load_revision(day, revision)
+    names = (PARSER, *PARTS)
+    if not all(_takes_source(getattr(module, name, None)) for name in names):
+        raise LookupError(
+            f"{day.label} at {revision} does not define {', '.join(names)} taking the input as an argument; "
+            "--against supports only revisions whose solvers do."
+        )
+    return list(_measure_module(day, module, f" @{revision}"))
+
+
+def _isolated(func: Callable[..., list[MemoryStats]], *args) -> list[MemoryStats]:
+    # a fresh interpreter per measurement, since the RSS high-water mark never drops back after a large day
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(func, *args).result()
+
+
+def memory_day(day: Day) -> list[MemoryStats]:
+    return _isolated(_measure_day, day)
+
+
+def compare_revision(day: Day, revision: str) -> list[tuple[MemoryStats, MemoryStats]]:
+    old = _isolated(_measure_revision, day, revision)
+    return list(zip(old, memory_day(day)))
+
+
+def format_change(old: MemoryStats, new: MemoryStats) -> str:
+    changes = [
+        f"{metric} {getattr(old, metric)} -> {getattr(new, metric)} "
+        f"({getattr(new, metric) / max(getattr(old, metric), 1) - 1:+.0%})"
+        for metric in ("traced_peak", "peak_blocks")
+    ]
+    return f"{new.name} | {' | '.join(changes)}"
+
+
+def dump_stats(stats: Iterable[MemoryStats], path: str) -> None:
+    with open(path, "w") as file:
+        json.dump([s.to_dict() for s in stats], file, indent=2)
+
+
+def load_baseline(path: str) -> dict[str, dict[str, int]]:
+    with open(path) as file:
+        return {entry["name"]: entry for entry in json.load(file)}
+
+
+def check(
+    stats: MemoryStats,
+    baseline: dict[str, dict[str, int]] | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_rss: int | None = None,
+    max_traced: int | None = None,
+) -> list[str]:
+    problems: list[str] = []
+    if max_rss is not None and stats.peak_rss > max_rss:
+        problems.append(f"{stats.name}: peak RSS {format_bytes(stats.peak_rss)} over {format_bytes(max_rss)}")
+    if max_traced is not None and stats.traced_peak > max_traced:
+        problems.append(f"{stats.name}: traced peak {format_bytes(stats.traced_peak)} over {format_bytes(max_traced)}")
+    previous = (baseline or {}).get(stats.name)
+    if previous is None:
+        return problems
+    for metric in METRICS:
+        old, new = previous[metric], getattr(stats, metric)
+        if new > old * (1 + tolerance) and new - old > NOISE_FLOOR[metric]:
+            problems.append(f"{stats.name}: {metric} grew from {old} to {new} ({new / max(old, 1) - 1:+.0%})")
+    return problems
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Any, Callable, Iterable
+
+from aoc.days import Day
+
+TOP_FUNCTIONS: int = 25
+TOP_ALLOCATIONS: int = 15
+DEFAULT_SAMPLE_INTERVAL: float = 0.001
+# the profilers' own bookkeeping, left out of the allocation report
+IGNORED_ALLOCATIONS: tuple[str, ...] = (tracemalloc.__file__, threading.__file__, __file__)
+# take a new allocation snapshot whenever traced memory exceeds the last one by this factor
+SNAPSHOT_GROWTH: float = 1.1
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class Sampler:
+    def __init__(self, root: Callable, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        self.root = root.__code__
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._target = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._switch_interval = sys.getswitchinterval()
+
+    def __enter__(self) -> Sampler:
+        self._target = threading.get_ident()
+        sys.setswitchinterval(min(self._switch_interval, self.interval / 2))
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            stack = self._stack(sys._current_frames().get(self._target))
+            if stack is not None:
+                self.stacks[stack] += 1
+
+    def _stack(self, frame: FrameType | None) -> str | None:
+        names: list[str] = []
+        while frame is not None:
+            names.append(_frame_name(frame))
+            if frame.f_code is self.root:
+                return ";".join(reversed(names))
+            frame = frame.f_back
+        return None
+
+
+class PeakSnapshots:
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak = 0
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self._snapshot_size = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> PeakSnapshots:
+        tracemalloc.start()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            current = tracemalloc.get_traced_memory()[0]
+            if current > self._snapshot_size * SNAPSHOT_GROWTH:
+                self.snapshot = tracemalloc.take_snapshot()
+                self._snapshot_size = current
+
+
+@dataclass
+class PartProfile:
+    part: str
+    stats: pstats.Stats | None = None
+    peak: int = 0
+    allocations: list[tracemalloc.Statistic] = field(default_factory=list)
+    stacks: Counter[str] | None = None
+    error: str | None = None
+
+    def report(self) -> str:
+        if self.error:
+            return f"== {self.part} ==\nnot profiled: {self.error}\n"
+        out = io.StringIO()
+        out.write(f"== {self.part} ==\n")
+        if self.stats is not None:
+            self.stats.stream = out  # type: ignore[attr-defined]
+            self.stats.sort_stats(pstats.SortKey.TIME).print_stats(TOP_FUNCTIONS)
+        out.write(f"peak traced memory: {format_bytes(self.peak)}\n")
+        for stat in self.allocations:
+            frame = stat.traceback[0]
+            out.write(f"  {format_bytes(stat.size):>10}  {stat.count:>9} blocks  {frame.filename}:{frame.lineno}\n")
+        if self.stacks is not None:
+            out.write(f"{sum(self.stacks.values())} stack samples\n")
+        return out.getvalue()
+
+
+def format_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def profile_part(func: Callable, data: Any, part: str, sample: bool = False) -> PartProfile:
+    result = PartProfile(part)
+    try:
+        profiler = cProfile.Profile()
+        profiler.runcall(func, data)
+        result.stats = pstats.Stats(profiler)
+        with PeakSnapshots() as peaks:
+            func(data)
+        result.peak = peaks.peak
+        if peaks.snapshot is not None:
+            snapshot = peaks.snapshot.filter_traces([tracemalloc.Filter(False, path) for path in IGNORED_ALLOCATIONS])
+            result.allocations = snapshot.statistics("lineno")[:TOP_ALLOCATIONS]
+        if sample:
+            with Sampler(func) as sampler:
+                func(data)
+            result.stacks = sampler.stacks
+    except Exception as exc:
+        result.error = f"{type(exc).__name__}: {exc}"
+    return result
+
+
+def write_day_profile(day: Day, profiles: Iterable[PartProfile], directory: str | os.PathLike) -> None:
+    os.makedirs(directory, exist_ok=True)
+    stem = os.path.join(directory, day.label.replace("/", "-"))
+    profiles = list(profiles)
+    with open(f"{stem}.txt", "w") as report:
+        report.write("\n".join(p.report() for p in profiles))
+    for profile in profiles:
+        if profile.stats is not None:
+            profile.stats.dump_stats(f"{stem}-{profile.part}.prof")
+    if any(p.stacks for p in profiles):
+        with open(f"{stem}.folded", "w") as folded:
+            for profile in profiles:
+                for stack, count in sorted((profile.stacks or {}).items()):
+                    folded.write(f"{profile.part};{stack} {count}\n")
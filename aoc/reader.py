@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import mmap
+import os
+import re
+from array import array
+from typing import IO, Any, Callable, Iterator, TypeAlias, TypeGuard, TypeVar, cast
+
+Source: TypeAlias = str | os.PathLike | bytes | bytearray | memoryview | IO
+T = TypeVar("T")
+
+WHITESPACE: bytes = b" \t\r\n\x0b\x0c"
+_WHITESPACE_TEXT: str = WHITESPACE.decode()
+INT_PATTERN = re.compile(rb"-?\d+")
+
+
+class ByteGrid:
+    def __init__(self, data: memoryview, height: int, width: int, stride: int):
+        self.data = data
+        self.height = height
+        self.width = width
+        self.stride = stride
+
+    def __getitem__(self, loc: tuple[int, int]) -> int:
+        r, c = loc
+        if not (0 <= r < self.height and 0 <= c < self.width):
+            raise IndexError(loc)
+        return self.data[r * self.stride + c]
+
+    def row(self, r: int) -> memoryview:
+        start = r * self.stride
+        return self.data[start : start + self.width]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} {self.height}x{self.width}"
+
+
+def is_source(data: Any) -> TypeGuard[Source]:
+    return isinstance(data, (str, os.PathLike, bytes, bytearray, memoryview)) or hasattr(data, "read")
+
+
+def read_bytes(source: Source) -> bytes:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if hasattr(source, "read"):
+        content = source.read()
+        return content.encode() if isinstance(content, str) else content
+    with open(source, "rb") as file:
+        return file.read()
+
+
+def resolve(data: Source | T, parser: Callable[[Source], T], parsed_type: type[T] | None = None) -> T:
+    if parsed_type is not None and isinstance(data, parsed_type):
+        return data
+    if is_source(data):
+        return parser(data)  # type: ignore[arg-type]
+    return data  # type: ignore[return-value]
+
+
+class MappedInput:
+    def __init__(self, source: Source):
+        self._file: IO[bytes] | None = None
+        self._map: mmap.mmap | None = None
+        self._source: mmap.mmap | bytes
+        if isinstance(source, (str, os.PathLike)):
+            self._file = open(source, "rb")
+            if os.fstat(self._file.fileno()).st_size:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._source = self._map if self._map is not None else b""
+        else:
+            self._source = read_bytes(source)
+        self.data: memoryview = memoryview(self._source)
+        self._bounds: array | None = None
+
+    def __enter__(self) -> MappedInput:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.data.release()
+        if self._map is not None:
+            self._map.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def line_bounds(self) -> array:
+        if self._bounds is None:
+            bounds = array("q", [0])
+            source = self._source
+            pos = source.find(b"\n")
+            while pos != -1:
+                bounds.append(pos + 1)
+                pos = source.find(b"\n", pos + 1)
+            if bounds[-1] != len(self.data):
+                bounds.append(len(self.data) + 1)
+            self._bounds = bounds
+        return self._bounds
+
+    def chunks(self, size: int) -> list[tuple[int, int]]:
+        bounds: list[tuple[int, int]] = []
+        start, total = 0, len(self.data)
+        while start < total:
+            newline = self._source.find(b"\n", start + size - 1) if start + size < total else -1
+            stop = total if newline == -1 else newline + 1
+            bounds.append((start, stop))
+            start = stop
+        return bounds
+
+    def _span(self, i: int) -> tuple[int, int]:
+        bounds = self.line_bounds()
+        start, end = bounds[i], min(bounds[i + 1], len(self.data))
+        data = self.data
+        while end > start and data[end - 1] in WHITESPACE:
+            end -= 1
+        return start, end
+
+    def __iter__(self) -> Iterator[memoryview]:
+        return self.lines()
+
+    def line_count(self) -> int:
+        return len(self.line_bounds()) - 1
+
+    def line(self, i: int) -> memoryview:
+        start, end = self._span(i)
+        return self.data[start:end]
+
+    def lines(self) -> Iterator[memoryview]:
+        for i in range(self.line_count()):
+            yield self.line(i)
+
+    def text_lines(self, encoding: str = "utf-8") -> Iterator[str]:
+        for i in range(self.line_count()):
+            start, end = self._span(i)
+            yield str(self.data[start:end], encoding)
+
+    def grid(self) -> ByteGrid:
+        bounds = self.line_bounds()
+        width = self._span(0)[1] if len(bounds) > 1 else 0
+        stride = bounds[1] - bounds[0] if len(bounds) > 1 else 0
+        height = len(bounds) - 1
+        while height and self._span(height - 1)[0] == self._span(height - 1)[1]:
+            height -= 1
+        return ByteGrid(self.data, height, width, stride)
+
+    def ints(self, line: int | None = None) -> Iterator[int]:
+        if line is None:
+            return (int(m[0]) for m in INT_PATTERN.finditer(self._source))
+        start, end = self._span(line)
+        return (int(m[0]) for m in INT_PATTERN.finditer(self._source, start, end))
+
+
+def read_lines(source: Source) -> Iterator[str]:
+    if hasattr(source, "read"):
+        # streams, stdin and pipes are read a line at a time instead of being loaded whole
+        for line in cast(IO, source):
+            yield (line.decode() if isinstance(line, bytes) else line).rstrip(_WHITESPACE_TEXT)
+        return
+    with MappedInput(source) as mapped:
+        yield from mapped.text_lines()
+
+
+def read_chunks(source: Source, size: int) -> Iterator[bytes | memoryview]:
+    if hasattr(source, "read"):
+        # a stream is read a block at a time, and the partial line at the end of a block moves to the next one
+        tail = b""
+        while block := cast(IO, source).read(size):
+            buffer = tail + (block.encode() if isinstance(block, str) else block)
+            cut = buffer.rfind(b"\n") + 1
+            if cut:
+                yield buffer[:cut]
+            tail = buffer[cut:]
+        if tail:
+            yield tail
+        return
+    with MappedInput(source) as mapped:
+        for start, stop in mapped.chunks(size):
+            # released once the caller is done with it, so that the mapping can close behind the last one
+            view = mapped.data[start:stop]
+            try:
+                yield view
+            finally:
+                view.release()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import os
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Iterable, Iterator
+
+from aoc.bench import format_seconds, time_call
+from aoc.cache import answer_cache, answer_key, load_parsed, parsed_cache
+from aoc.days import PARSER, PARTS, Day, load
+from aoc.profiling import profile_part, write_day_profile
+from aoc.reader import Source, read_bytes
+
+
+@dataclass
+class PartResult:
+    part: str
+    answer: Any = None
+    seconds: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class DayResult:
+    day: Day
+    parts: list[PartResult] = field(default_factory=list)
+    skipped: str | None = None
+    cached: bool = False
+
+    @property
+    def seconds(self) -> float:
+        return sum(p.seconds for p in self.parts)
+
+    @property
+    def failed(self) -> bool:
+        return any(p.error for p in self.parts)
+
+
+def run_part(module: Any, part: str, data: Any) -> PartResult:
+    try:
+        answer, seconds = time_call(getattr(module, part), data)
+    except Exception as exc:
+        return PartResult(part, error=_describe(exc))
+    return PartResult(part, answer, seconds)
+
+
+def run_day(
+    day: Day,
+    use_cache: bool = True,
+    source: Source | None = None,
+    profile: str | os.PathLike | None = None,
+    sample: bool = False,
+    rerun: bool = False,
+) -> DayResult:
+    result = DayResult(day)
+    if source is None and not day.input_path.is_file():
+        result.skipped = f"no {day.input_path.name}"
+        return result
+    answers = answer_cache() if use_cache and not rerun and profile is None else None
+    key = ""
+    try:
+        module = load(day)
+        if answers is not None:
+            source = read_bytes(day.input_path if source is None else source)
+            key = answer_key(answers, module, source)
+            found, solved = answers.get(key)
+            if found:
+                result.parts = [PartResult(PARSER)] + [PartResult(part, answer) for part, answer in solved]
+                result.cached = True
+                return result
+        cache = parsed_cache() if use_cache else None
+        (data, cached), seconds = time_call(load_parsed, day, module, cache, source)
+    except Exception as exc:
+        result.parts = [PartResult(PARSER, error=_describe(exc))]
+        return result
+    result.parts = [PartResult(PARSER, "cached" if cached else None, seconds)]
+    result.parts.extend(run_part(module, part, data) for part in PARTS)
+    if answers is not None and not result.failed:
+        answers.put(key, [(p.part, p.answer) for p in result.parts[1:]])
+    if profile is not None:
+        solved = [p.part for p in result.parts[1:] if not p.error]
+        write_day_profile(day, (profile_part(getattr(module, part), data, part, sample) for part in solved), profile)
+    return result
+
+
+def _describe(exc: BaseException) -> str:
+    frame = traceback.extract_tb(exc.__traceback__)[-1]
+    return f"{type(exc).__name__}: {exc} ({os.path.basename(frame.filename)}:{frame.lineno})"
+
+
+def run_days(
+    days: Iterable[Day],
+    workers: int | None = None,
+    use_cache: bool = True,
+    threads: bool = False,
+    profile: str | os.PathLike | None = None,
+    sample: bool = False,
+    rerun: bool = False,
+) -> Iterator[DayResult]:
+    days = list(days)
+    solve = partial(run_day, use_cache=use_cache, profile=profile, sample=sample, rerun=rerun)
+    if workers == 1:
+        yield from map(solve, days)
+        return
+    pool: Executor = ThreadPoolExecutor(max_workers=workers) if threads else ProcessPoolExecutor(max_workers=workers)
+    with pool:
+        futures = [pool.submit(solve, day) for day in days]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def format_table(results: Iterable[DayResult]) -> str:
+    rows: list[tuple[str, ...]] = [("day", "part", "answer", "time")]
+    for res in sorted(results, key=lambda r: r.day):
+        if res.skipped:
+            rows.append((res.day.label, "-", f"skipped: {res.skipped}", "-"))
+        for part in res.parts:
+            answer = f"ERROR {part.error}" if part.error else "" if part.answer is None else str(part.answer)
+            seconds = "cached" if res.cached else format_seconds(part.seconds)
+            rows.append((res.day.label, part.part, answer, seconds))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = ["  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip() for row in rows]
+    lines.insert(1, "  ".join("-" * w for w in widths))
+    return "\n".join(lines)
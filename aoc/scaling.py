@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+
+from aoc.bench import BenchStats, benchmark
+from aoc.days import PARSER, PARTS, Day, load
+from aoc.generators import generate
+
+DEFAULT_SCALES: tuple[float, ...] = (0.25, 0.5, 1.0, 2.0, 4.0)
+DEFAULT_BUDGET: float = 10.0
+
+
+@dataclass
+class ScalePoint:
+    day: Day
+    scale: float
+    size: int
+    stats: list[BenchStats] = field(default_factory=list)
+
+    @property
+    def slowest(self) -> float:
+        return max(s.median for s in self.stats)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "day": self.day.label,
+            "scale": self.scale,
+            "size": self.size,
+            "stats": [s.to_dict() for s in self.stats],
+        }
+
+    def __str__(self) -> str:
+        return f"{self.day.label} x{self.scale:g} ({self.size} bytes)\n" + "\n".join(f"  {s}" for s in self.stats)
+
+
+def scale_day(
+    day: Day,
+    scales: Iterable[float] = DEFAULT_SCALES,
+    seed: int = 0,
+    warmup: int = 0,
+    repeat: int = 1,
+    budget: float | None = DEFAULT_BUDGET,
+    parts: Iterable[str] = PARTS,
+) -> Iterator[ScalePoint]:
+    module = load(day)
+    for scale in sorted(scales):
+        content = generate(day, scale, seed).encode()
+        point = ScalePoint(day, scale, len(content))
+        parsing = benchmark(getattr(module, PARSER), content, warmup=warmup, repeat=repeat, name=PARSER)
+        data, parsing.answer = parsing.answer, None
+        point.stats.append(parsing)
+        for part in parts:
+            point.stats.append(benchmark(getattr(module, part), data, warmup=warmup, repeat=repeat, name=part))
+        yield point
+        if budget is not None and point.slowest > budget:
+            break
+
+
+def dump_points(points: Iterable[ScalePoint], path: str) -> None:
+    with open(path, "w") as file:
+        json.dump([p.to_dict() for p in points], file, indent=2)
+
+
+def plot_points(points: Iterable[ScalePoint], path: str) -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    by_day: dict[Day, list[ScalePoint]] = {}
+    for point in points:
+        by_day.setdefault(point.day, []).append(point)
+    cols = min(4, len(by_day))
+    rows = -(-len(by_day) // cols)
+    fig, axes = plt.subplots(rows, cols, figsize=(4 * cols, 3.5 * rows), squeeze=False)
+    for ax, (day, day_points) in zip(axes.flat, sorted(by_day.items())):
+        sizes = [p.size for p in day_points]
+        for i, name in enumerate(s.name for s in day_points[0].stats):
+            ax.plot(sizes, [p.stats[i].median for p in day_points], marker="o", label=name)
+        ax.set(title=day.label, xscale="log", yscale="log", xlabel="input bytes", ylabel="median seconds")
+        ax.legend(fontsize="small")
+    for ax in list(axes.flat)[len(by_day) :]:
+        ax.set_visible(False)
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+from aoc.bench import format_seconds
+from aoc.days import ROOT, Day
+
+DEFAULT_BUDGET: float = 0.05
+CLI_BUDGET: float = 0.25
+CLI_MODULE: str = "aoc.cli"
+_MARKER = "-- aoc startup probe --"
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+_DAY_PROBE = f"""
+import sys, time
+from aoc.days import find, load
+day = find({{year}}, {{day}})
+print({_MARKER!r}, file=sys.stderr, flush=True)
+start = time.perf_counter()
+load(day)
+print(time.perf_counter() - start)
+"""
+_MODULE_PROBE = f"""
+import sys, time
+print({_MARKER!r}, file=sys.stderr, flush=True)
+start = time.perf_counter()
+import {{module}}
+print(time.perf_counter() - start)
+"""
+
+
+@dataclass
+class Import:
+    module: str
+    seconds: float
+
+
+@dataclass
+class Startup:
+    name: str
+    seconds: float
+    imports: list[Import] = field(default_factory=list)
+
+    def over(self, budget: float) -> bool:
+        return self.seconds > budget
+
+    def heaviest(self, count: int) -> list[Import]:
+        return sorted(self.imports, key=lambda i: i.seconds, reverse=True)[:count]
+
+    def __str__(self) -> str:
+        return f"{self.name}: {format_seconds(self.seconds)}"
+
+
+def _probe(name: str, code: str) -> Startup:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    _, _, log = proc.stderr.partition(_MARKER)
+    lines = [(len(m[3]) // 2, m[4], int(m[2]) / 1e6) for m in _IMPORT_LINE.finditer(log)]
+    # a probed module is its own only top-level import, what it pulls in is one level down
+    depth = 1 if any(d == 0 and module == name for d, module, _ in lines) else 0
+    imports = [Import(module, seconds) for d, module, seconds in lines if d == depth]
+    return Startup(name, float(proc.stdout.split()[-1]), imports)
+
+
+def startup_module(module: str = CLI_MODULE) -> Startup:
+    return _probe(module, _MODULE_PROBE.format(module=module))
+
+
+def startup_day(day: Day) -> Startup:
+    return _probe(day.label, _DAY_PROBE.format(year=day.year, day=day.day))
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import hashlib
+import time
+import traceback
+from pathlib import Path
+from types import CodeType, FunctionType, MemberDescriptorType, ModuleType
+from typing import Any, Iterator
+
+from aoc.bench import benchmark, format_seconds, time_call
+from aoc.days import PARSER, PARTS, Day, load, reload
+
+DEFAULT_INTERVAL: float = 0.5
+DEFAULT_REPEAT: int = 3
+
+
+def _hash_code(digest: Any, code: CodeType) -> None:
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _hash_code(digest, const)
+        else:
+            digest.update(repr(const).encode())
+
+
+def _names(code: CodeType) -> Iterator[str]:
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield from _names(const)
+
+
+def fingerprint(module: ModuleType, name: str) -> str:
+    # hashes the bytecode of a function and of everything in the module it reaches, ignoring line numbers,
+    # so editing one part leaves the other part's fingerprint alone
+    digest = hashlib.blake2b(digest_size=16)
+    seen: set[int] = set()
+    stack: list[Any] = [getattr(module, name)]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, FunctionType):
+            _hash_code(digest, obj.__code__)
+            digest.update(repr(obj.__defaults__).encode())
+            for ref in sorted(set(_names(obj.__code__))):
+                if ref in vars(module):
+                    stack.append(vars(module)[ref])
+        elif isinstance(obj, type) and obj.__module__ == module.__name__:
+            digest.update(obj.__qualname__.encode())
+            for attr_name, attr in sorted(vars(obj).items()):
+                attr = getattr(attr, "__func__", attr)
+                if isinstance(attr, property):
+                    stack.extend(f for f in (attr.fget, attr.fset, attr.fdel) if f is not None)
+                elif isinstance(attr, FunctionType):
+                    stack.append(attr)
+                elif not (_is_dunder(attr_name) or attr_name == "_abc_impl" or isinstance(attr, MemberDescriptorType)):
+                    stack.append(attr)
+        elif not isinstance(obj, (ModuleType, type)) and not callable(obj):
+            # a default repr carries the object's address, which differs on every reload
+            text = type(obj).__qualname__ if type(obj).__repr__ is object.__repr__ else repr(obj)
+            digest.update(text.encode())
+    return digest.hexdigest()
+
+
+def _is_dunder(name: str) -> bool:
+    return name.startswith("__") and name.endswith("__")
+
+
+def fingerprints(module: ModuleType) -> dict[str, str]:
+    return {name: fingerprint(module, name) for name in (PARSER, *PARTS)}
+
+
+def unstable_fingerprints(day: Day) -> list[str]:
+    # reloading an unchanged file must not change any fingerprint, or watch re-times those parts on every save
+    before = fingerprints(load(day))
+    after = fingerprints(reload(day))
+    return [name for name in before if before[name] != after[name]]
+
+
+def _mtimes(day: Day) -> dict[Path, tuple[int, int]]:
+    stamps: dict[Path, tuple[int, int]] = {}
+    for path in (day.path, day.input_path):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        stamps[path] = (st.st_mtime_ns, st.st_size)
+    return stamps
+
+
+def _error(exc: BaseException) -> str:
+    return "".join(traceback.format_exception_only(type(exc), exc)).rstrip()
+
+
+def watch_day(
+    day: Day, interval: float = DEFAULT_INTERVAL, warmup: int = 0, repeat: int = DEFAULT_REPEAT
+) -> Iterator[str]:
+    unstable = unstable_fingerprints(day)
+    if unstable:
+        yield f"{day.label}: {', '.join(unstable)} fingerprint differently on every reload and are always re-timed"
+    module = load(day)
+    prints: dict[str, str] = {}
+    stamps: dict[Path, tuple[int, int]] = {}
+    data: Any = None
+    parsed = False
+    while True:
+        current = _mtimes(day)
+        if current == stamps:
+            time.sleep(interval)
+            continue
+        changed = {path for path in current.keys() | stamps.keys() if current.get(path) != stamps.get(path)}
+        first, stamps = not stamps, current
+        if not first:
+            yield f"changed: {', '.join(sorted(path.name for path in changed))}"
+        try:
+            if not first and day.path in changed:
+                module = reload(day)
+            new = fingerprints(module)
+            if not parsed or day.input_path in changed or new[PARSER] != prints[PARSER]:
+                parsed = False
+                data, seconds = time_call(getattr(module, PARSER), day.input_path)
+                parsed = True
+                yield f"{day.label} {PARSER}: {format_seconds(seconds)}"
+                parts = list(PARTS)
+            else:
+                parts = [part for part in PARTS if new[part] != prints[part]]
+        except Exception as exc:
+            yield f"{day.label}: {_error(exc)}"
+            continue
+        prints = new
+        if not parts:
+            yield f"{day.label}: no part changed"
+        for part in parts:
+            try:
+                stats = benchmark(getattr(module, part), data, warmup=warmup, repeat=repeat, name=f"{day.label} {part}")
+            except Exception as exc:
+                yield f"{day.label} {part}: {_error(exc)}"
+                continue
+            yield str(stats)